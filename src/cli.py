@@ -14,6 +14,8 @@ import sys
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -138,13 +140,10 @@ def run_similarity_analysis(args: argparse.Namespace) -> None:
     logger.info(f"\nSimilarity Results (threshold: {args.threshold}):")
     logger.info("-" * 50)
     
-    # Find high similarity pairs
-    high_similarity_pairs = []
-    for i in range(len(paths)):
-        for j in range(i + 1, len(paths)):
-            score = matrix[i][j] if isinstance(matrix, list) else matrix.iloc[i, j]
-            if score >= args.threshold:
-                high_similarity_pairs.append((paths[i], paths[j], score))
+    # Find high similarity pairs in the upper triangle (DataFrames and arrays alike)
+    scores = np.asarray(matrix)
+    rows, cols = np.nonzero(np.triu(scores >= args.threshold, k=1))
+    high_similarity_pairs = [(paths[i], paths[j], float(scores[i, j])) for i, j in zip(rows, cols, strict=True)]
     
     # Sort by score
     high_similarity_pairs.sort(key=lambda x: x[2], reverse=True)
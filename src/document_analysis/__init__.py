@@ -27,7 +27,7 @@ from .reports import (
     generate_comprehensive_similarity_report,
 )
 from .similarity.semantic_similarity import analyze_active_document_similarities, analyze_semantic_similarity
-from .similarity.string_similarity import get_best_match_seq, is_similar, split_sections
+from .similarity.string_similarity import get_best_match_seq, is_similar, iter_sections, split_sections
 
 __version__ = "1.0.0"
 
@@ -47,6 +47,7 @@ __all__: list[str] = [
     # Core
     "get_best_match_seq",
     "is_similar",
+    "iter_sections",
     "load_markdown_files",
     # Merging
     "merge_documents",
@@ -5,10 +5,17 @@ This module provides functions for finding and loading documents with
 comprehensive validation and security checks according to CLAUDE.md standards.
 """
 
+import fnmatch
+import functools
 import logging
+import os
+import re
+from collections import OrderedDict
+from collections.abc import Collection, Iterator
 from pathlib import Path
 
 from .config import (
+    CACHE_SIZE_LIMIT,
     DEFAULT_ENCODING,
     DEFAULT_EXCLUDE_PATTERNS,
     MARKDOWN_FILE_PATTERN,
@@ -17,10 +24,68 @@ from .validation import ValidationError, validate_directory_path, validate_file_
 
 logger = logging.getLogger(__name__)
 
+# Cache of discovered documents keyed by (cwd, root_dir, file_pattern, exclude_patterns),
+# holding the st_mtime_ns of every directory the walk listed; an entry is reused only
+# while all of them are unchanged. cwd is part of the key because validate_file_path
+# accepts files by allowed base paths resolved against it
+_doc_cache: OrderedDict[tuple[str, str, str, tuple[str, ...]], tuple[dict[str, int], list[Path]]] = OrderedDict()
 
-def should_exclude(path: Path, exclude_patterns: list[str]) -> bool:
+# Validation results for load_markdown_files keyed by (cwd, path); the working
+# directory is part of the key because allowed base paths resolve against it.
+# Rejected paths are skipped while their directory's st_mtime_ns and their own
+# (st_mtime_ns, st_size, st_mode) are unchanged; accepted paths are reused while
+# their own st_mtime_ns is unchanged.
+_invalid_paths: OrderedDict[tuple[str, str], tuple[int | None, tuple[int, int, int] | None]] = OrderedDict()
+_valid_paths: OrderedDict[tuple[str, str], tuple[int, Path]] = OrderedDict()
+
+
+def _compile_exclude_patterns(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile exclude patterns into a single alternation regex.
+
+    Each pattern matches as a substring of the path, with ``*`` acting as a wildcard.
+
+    Args:
+        patterns: Exclude patterns to compile
+
+    Returns:
+        Compiled pattern, or None if there are no patterns
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(re.escape(pattern).replace(r"\*", ".*") for pattern in patterns))
+
+
+_DEFAULT_EXCLUDE_RE = _compile_exclude_patterns(tuple(DEFAULT_EXCLUDE_PATTERNS))
+_FILE_PATTERN_RE = re.compile(r"^[\w\*\.\-]+$")
+
+
+@functools.lru_cache(maxsize=128)
+def _exclude_regex(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Return the compiled exclude regex for patterns, compiling it once per pattern set."""
+    return _compile_exclude_patterns(patterns)
+
+
+@functools.lru_cache(maxsize=8)
+def _validated_file_pattern(file_pattern: str) -> str:
+    """Validate a file glob pattern, caching results for repeated patterns.
+
+    Args:
+        file_pattern: File pattern to validate
+
+    Returns:
+        Validated file pattern
+
+    Raises:
+        ValidationError: If the pattern is invalid
+    """
+    return validate_string_input(file_pattern, "file_pattern", max_length=50, pattern=_FILE_PATTERN_RE)
+
+
+def should_exclude(path: Path, exclude_patterns: Collection[str]) -> bool:
     """Check if path should be excluded based on patterns.
 
+    Patterns match as substrings of the path; ``*`` matches any run of characters.
+
     Args:
         path: Path to check
         exclude_patterns: List of patterns to exclude
@@ -32,8 +97,70 @@ def should_exclude(path: Path, exclude_patterns: list[str]) -> bool:
         >>> should_exclude(Path("node_modules/test.md"), ["node_modules"])
         True
     """
-    path_str = str(path)
-    return any(pattern in path_str for pattern in exclude_patterns)
+    if exclude_patterns is DEFAULT_EXCLUDE_PATTERNS:
+        exclude_re = _DEFAULT_EXCLUDE_RE
+    else:
+        exclude_re = _exclude_regex(tuple(exclude_patterns))
+    return exclude_re is not None and exclude_re.search(str(path)) is not None
+
+
+def _scan_matching_files(
+    root_dir: Path, file_pattern: str, exclude_re: re.Pattern[str] | None, dir_mtimes: dict[str, int] | None = None
+) -> Iterator[tuple[os.DirEntry[str], tuple[str, ...]]]:
+    """Walk root_dir with os.scandir and yield files matching file_pattern.
+
+    Excluded directories are pruned without being listed and symlinked
+    directories are not followed, as with ``Path.rglob``. Each yielded
+    ``os.DirEntry`` caches its stat result, so callers can inspect it
+    without further syscalls.
+
+    Args:
+        root_dir: Root directory to walk
+        file_pattern: Glob pattern matched against file names
+        exclude_re: Compiled exclude regex matched against full paths, or None
+        dir_mtimes: If given, filled with the st_mtime_ns of each directory listed
+
+    Yields:
+        Tuples of (file entry, directory parts relative to root_dir)
+
+    Raises:
+        OSError: If root_dir itself cannot be listed
+    """
+    stack: list[tuple[str, tuple[str, ...]]] = [(str(root_dir), ())]
+
+    while stack:
+        dir_path, rel_parts = stack.pop()
+        try:
+            # Stat before listing, so an entry added meanwhile still changes the recorded mtime
+            if dir_mtimes is not None:
+                dir_mtimes[dir_path] = os.stat(dir_path).st_mtime_ns
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError as e:
+            if not rel_parts:
+                raise
+            logger.debug(f"Skipping unreadable directory {dir_path}: {e}")
+            continue
+
+        for entry in entries:
+            if exclude_re is not None and exclude_re.search(entry.path):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, (*rel_parts, entry.name)))
+                elif fnmatch.fnmatchcase(entry.name, file_pattern) and entry.is_file():
+                    yield entry, rel_parts
+            except OSError as e:
+                logger.debug(f"Skipping unreadable entry {entry.path}: {e}")
+                continue
+
+
+def _dirs_unchanged(dir_mtimes: dict[str, int]) -> bool:
+    """Check that every directory still has the st_mtime_ns recorded when it was walked."""
+    try:
+        return all(os.stat(dir_path).st_mtime_ns == mtime for dir_path, mtime in dir_mtimes.items())
+    except OSError:
+        return False
 
 
 def find_active_documents(
@@ -45,6 +172,9 @@ def find_active_documents(
     """Find all active documents in the project.
 
     Active documents are those not in excluded directories like not_in_use, .venv, etc.
+    Results are cached per (root_dir, file_pattern, exclude_patterns) and reused
+    while the modification time of every directory walked is unchanged, so
+    adding, removing or renaming a file anywhere in the tree is picked up.
 
     Args:
         root_dir: Root directory to search (defaults to current working directory)
@@ -80,24 +210,34 @@ def find_active_documents(
 
     # Validate file pattern
     try:
-        file_pattern = validate_string_input(file_pattern, "file_pattern", max_length=50, pattern=r"^[\w\*\.\-]+$")
+        file_pattern = _validated_file_pattern(file_pattern)
     except ValidationError as e:
         logger.error(f"Invalid file pattern: {e}")
         raise
 
+    # Serve from cache while no directory in the tree has changed
+    cache_key = (str(Path.cwd()), str(root_dir.resolve()), file_pattern, tuple(sorted(exclude_patterns)))
+    cached = _doc_cache.get(cache_key)
+    if cached is not None and _dirs_unchanged(cached[0]):
+        _doc_cache.move_to_end(cache_key)
+        if verbose:
+            logger.info(f"Found {len(cached[1])} active documents in {root_dir} (cached)")
+        return list(cached[1])
+
     active_docs: list[Path] = []
+    exclude_re = _exclude_regex(tuple(exclude_patterns))
+    dir_mtimes: dict[str, int] = {}
 
     try:
         # Find all files matching pattern
-        for path in root_dir.rglob(file_pattern):
-            if not should_exclude(path, exclude_patterns) and path.is_file():
-                try:
-                    # Additional validation for each file
-                    validated_path = validate_file_path(path, must_exist=True)
-                    active_docs.append(validated_path)
-                except ValidationError as e:
-                    logger.debug(f"Skipping invalid file {path}: {e}")
-                    continue
+        for entry, _ in _scan_matching_files(root_dir, file_pattern, exclude_re, dir_mtimes):
+            try:
+                # Additional validation for each file, reusing the entry's cached stat
+                validated_path = validate_file_path(entry.path, must_exist=True, stat_result=entry.stat())
+                active_docs.append(validated_path)
+            except (OSError, ValidationError) as e:
+                logger.debug(f"Skipping invalid file {entry.path}: {e}")
+                continue
 
     except OSError as e:
         logger.error(f"Error accessing directory {root_dir}: {e}")
@@ -106,6 +246,11 @@ def find_active_documents(
     # Sort for consistent output
     active_docs.sort()
 
+    _doc_cache[cache_key] = (dir_mtimes, list(active_docs))
+    _doc_cache.move_to_end(cache_key)
+    if len(_doc_cache) > CACHE_SIZE_LIMIT:
+        _doc_cache.popitem(last=False)
+
     if verbose:
         logger.info(f"Found {len(active_docs)} active documents in {root_dir}")
         logger.info(f"Excluded patterns: {', '.join(exclude_patterns[:5])}...")
@@ -113,6 +258,76 @@ def find_active_documents(
     return active_docs
 
 
+def clear_document_cache() -> None:
+    """Clear cached document discovery and path validation results."""
+    _doc_cache.clear()
+    _invalid_paths.clear()
+    _valid_paths.clear()
+
+
+def _parent_mtime(path: str | Path) -> int | None:
+    """Return the modification time of a path's directory, or None if it cannot be read."""
+    try:
+        return Path(path).parent.stat().st_mtime_ns
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+def _file_state(path: str | Path) -> tuple[int, int, int] | None:
+    """Return a path's (st_mtime_ns, st_size, st_mode), or None if it cannot be read."""
+    try:
+        stat_result = Path(path).stat()
+    except (OSError, TypeError, ValueError):
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_mode
+
+
+def _validate_cached_file_path(path: str | Path, cwd: str) -> Path:
+    """Validate a file path, reusing earlier results for the same path.
+
+    A failure is reused while neither the path's directory nor the file itself
+    has changed, so a file created, renamed into place, truncated or made
+    readable after a failed probe is validated again.
+
+    Args:
+        path: File path to validate
+        cwd: Current working directory, part of the cache key
+
+    Returns:
+        Validated Path object
+
+    Raises:
+        ValidationError: If the path fails validation or failed it before
+    """
+    key = (cwd, str(path))
+    file_state = _file_state(path)
+    if key in _invalid_paths:
+        if _invalid_paths[key] == (_parent_mtime(path), file_state):
+            raise ValidationError(f"Path previously failed validation: {path}")
+        del _invalid_paths[key]
+
+    mtime = file_state[0] if file_state is not None else None
+
+    cached = _valid_paths.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        validated_path = validate_file_path(path, must_exist=True)
+    except ValidationError:
+        _invalid_paths[key] = (_parent_mtime(path), file_state)
+        if len(_invalid_paths) > CACHE_SIZE_LIMIT:
+            _invalid_paths.popitem(last=False)
+        raise
+
+    if mtime is not None:
+        _valid_paths[key] = (mtime, validated_path)
+        if len(_valid_paths) > CACHE_SIZE_LIMIT:
+            _valid_paths.popitem(last=False)
+
+    return validated_path
+
+
 def find_not_in_use_documents(root_dir: str | Path | None = None, file_pattern: str = MARKDOWN_FILE_PATTERN) -> list[Path]:
     """Find all documents in not_in_use directories.
 
@@ -139,7 +354,7 @@ def find_not_in_use_documents(root_dir: str | Path | None = None, file_pattern:
 
     # Validate file pattern
     try:
-        file_pattern = validate_string_input(file_pattern, "file_pattern", max_length=50, pattern=r"^[\w\*\.\-]+$")
+        file_pattern = _validated_file_pattern(file_pattern)
     except ValidationError as e:
         logger.error(f"Invalid file pattern: {e}")
         raise
@@ -174,6 +389,11 @@ def find_not_in_use_documents(root_dir: str | Path | None = None, file_pattern:
 def load_markdown_files(path_list: list[Path], root_dir: str | Path) -> dict[str, str]:
     """Load markdown files and return their content indexed by relative path.
 
+    Path validation results are cached across calls: paths that failed
+    validation are skipped while their directory's modification time is
+    unchanged, and paths that passed are reused while their own
+    modification time is unchanged. ``clear_document_cache()`` drops both.
+
     Args:
         path_list: List of Path objects to load
         root_dir: Root directory for relative path calculation
@@ -197,11 +417,12 @@ def load_markdown_files(path_list: list[Path], root_dir: str | Path) -> dict[str
         raise
 
     files: dict[str, str] = {}
+    cwd = str(Path.cwd())
 
     for path in path_list:
         try:
             # Validate each path
-            validated_path = validate_file_path(path, must_exist=True)
+            validated_path = _validate_cached_file_path(path, cwd)
 
             # Calculate relative path
             try:
@@ -212,6 +433,10 @@ def load_markdown_files(path_list: list[Path], root_dir: str | Path) -> dict[str
                 key = str(validated_path)
                 logger.debug(f"Using absolute path for {validated_path}")
 
+            # The same file listed more than once is read only once
+            if key in files:
+                continue
+
             # Load file content with proper encoding
             try:
                 content = validated_path.read_text(encoding=DEFAULT_ENCODING, errors="strict")
@@ -235,9 +460,58 @@ def load_markdown_files(path_list: list[Path], root_dir: str | Path) -> dict[str
     return files
 
 
+def _classify_walk(
+    root_dir: Path, file_pattern: str = MARKDOWN_FILE_PATTERN, exclude_patterns: list[str] | None = None
+) -> tuple[list[Path], list[Path], int]:
+    """Classify documents under root_dir in a single directory walk.
+
+    Files below a ``not_in_use_backup*`` directory are counted as backups,
+    files below a ``not_in_use`` directory as not_in_use, and everything else
+    that is not excluded as active.
+
+    Args:
+        root_dir: Validated root directory to walk
+        file_pattern: File pattern to match (default: "*.md")
+        exclude_patterns: Patterns to exclude (defaults to DEFAULT_EXCLUDE_PATTERNS)
+
+    Returns:
+        Tuple of (active documents, not_in_use documents, backup document count)
+    """
+    if exclude_patterns is None:
+        exclude_patterns = list(DEFAULT_EXCLUDE_PATTERNS)
+
+    active_docs: list[Path] = []
+    not_in_use_docs: list[Path] = []
+    backup_count = 0
+    exclude_re = _exclude_regex(tuple(exclude_patterns))
+
+    for entry, rel_parts in _scan_matching_files(root_dir, file_pattern, exclude_re):
+        if any(part.startswith("not_in_use_backup") for part in rel_parts):
+            backup_count += 1
+            continue
+
+        try:
+            validated_path = validate_file_path(entry.path, must_exist=True, stat_result=entry.stat())
+        except (OSError, ValidationError) as e:
+            logger.debug(f"Skipping invalid file {entry.path}: {e}")
+            continue
+
+        if "not_in_use" in rel_parts:
+            not_in_use_docs.append(validated_path)
+        else:
+            active_docs.append(validated_path)
+
+    active_docs.sort()
+    not_in_use_docs.sort()
+    return active_docs, not_in_use_docs, backup_count
+
+
 def count_documents_by_type(root_dir: str | Path | None = None) -> dict[str, int]:
     """Count different types of documents in the project.
 
+    Active, not_in_use and backup documents are disjoint categories collected
+    in a single walk of root_dir.
+
     Args:
         root_dir: Root directory to analyze
 
@@ -260,15 +534,7 @@ def count_documents_by_type(root_dir: str | Path | None = None) -> dict[str, int
 
     try:
         # Count different document types
-        active_docs = find_active_documents(root_dir, verbose=False)
-        not_in_use_docs = find_not_in_use_documents(root_dir)
-
-        # Count backup directories
-        backup_count = 0
-        for backup_dir in root_dir.glob("not_in_use_backup*"):
-            if backup_dir.is_dir():
-                backup_docs = list(backup_dir.rglob(MARKDOWN_FILE_PATTERN))
-                backup_count += len(backup_docs)
+        active_docs, not_in_use_docs, backup_count = _classify_walk(root_dir)
 
         counts = {
             "active_documents": len(active_docs),
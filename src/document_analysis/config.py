@@ -78,6 +78,9 @@ ALLOWED_BASE_PATHS: Final[frozenset[Path]] = frozenset(
 DEFAULT_MODEL_NAME: Final[str] = "sentence-transformers/all-MiniLM-L6-v2"
 MODEL_MAX_LENGTH: Final[int] = 512
 EMBEDDING_DIMENSION: Final[int] = 384
+SIMILARITY_BLOCK_ROWS: Final[int] = 4096  # Score rows per GPU block in pairwise similarity
+EMBEDDING_CACHE_DIR: Final[Path] = Path.home() / ".cache" / "bullet_proof" / "embeddings"
+DOCUMENT_CHUNK_SIZE: Final[int] = 8192  # Documents loaded and encoded together in bulk analysis
 
 # Validation rules
 VALIDATION_RULES: Final[dict[str, Any]] = {
@@ -7,7 +7,7 @@ from typing import Any
 
 import pandas as pd
 
-from .similarity.string_similarity import get_best_match_seq, is_similar, split_sections
+from .similarity.string_similarity import get_best_match_seq, is_similar, iter_sections, split_sections
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +34,8 @@ def merge_documents(
     Returns:
         Merged document content
     """
-    source_sections = split_sections(source_text, section_min_len)
+    # Source sections are consumed once; target sections are scanned per source section
+    source_sections = iter_sections(source_text, section_min_len)
     target_sections = split_sections(target_text, section_min_len)
 
     merged_text = target_text.strip()
@@ -91,10 +92,9 @@ def merge_similar_documents(
 
     merge_results: dict[str, list[dict[str, Any]]] = {"merged": [], "skipped": [], "errors": []}
 
-    for _, row in merge_candidates.iterrows():
-        doc1_path = root_dir / row["doc1"]
-        doc2_path = root_dir / row["doc2"]
-        similarity = row["similarity"]
+    for doc1, doc2, similarity in merge_candidates[["doc1", "doc2", "similarity"]].itertuples(index=False, name=None):
+        doc1_path = root_dir / doc1
+        doc2_path = root_dir / doc2
 
         # Determine merge direction (merge smaller into larger)
         try:
@@ -103,10 +103,10 @@ def merge_similar_documents(
 
             if doc1_size > doc2_size:
                 target_path, source_path = doc1_path, doc2_path
-                target_name, source_name = row["doc1"], row["doc2"]
+                target_name, source_name = doc1, doc2
             else:
                 target_path, source_path = doc2_path, doc1_path
-                target_name, source_name = row["doc2"], row["doc1"]
+                target_name, source_name = doc2, doc1
 
             logger.info("📋 Merge candidate: %s → %s (%.1f%% similar)", source_name, target_name, similarity * 100)
 
@@ -145,8 +145,8 @@ def merge_similar_documents(
             )
 
         except (OSError, ValueError, KeyError) as e:
-            logger.error("   ❌ Failed to merge %s and %s: %s", row["doc1"], row["doc2"], e)
-            merge_results["errors"].append({"doc1": row["doc1"], "doc2": row["doc2"], "error": str(e)})
+            logger.error("   ❌ Failed to merge %s and %s: %s", doc1, doc2, e)
+            merge_results["errors"].append({"doc1": doc1, "doc2": doc2, "error": str(e)})
 
     # Summary
     logger.info("🔗 MERGE SUMMARY:")
@@ -262,7 +262,7 @@ def merge_document_list(
             source_content = doc_path.read_text(encoding="utf-8", errors="ignore")
 
             # Count sections before merge
-            before_sections = len(split_sections(merged_content, section_min_len))
+            before_sections = sum(1 for _ in iter_sections(merged_content, section_min_len))
 
             merged_content = merge_documents(
                 source_content,
@@ -273,7 +273,7 @@ def merge_document_list(
             )
 
             # Count sections after merge
-            after_sections = len(split_sections(merged_content, section_min_len))
+            after_sections = sum(1 for _ in iter_sections(merged_content, section_min_len))
             sections_added = after_sections - before_sections
             total_sections_added += sections_added
 
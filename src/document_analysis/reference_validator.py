@@ -10,9 +10,12 @@ Validates document references in DOCUMENT_REFERENCE_MAP.md to ensure:
 This module combines the functionality of both the basic and enhanced validators.
 """
 
+import heapq
 import logging
+import os
 import re
-from collections import defaultdict
+import sys
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
@@ -20,6 +23,66 @@ from .analyzers import find_active_documents
 
 logger = logging.getLogger(__name__)
 
+# Reference map patterns, e.g. "│   ├── 🔗 → PLANNING.md ✅"
+_REF_RE = re.compile(r"🔗 → ([^\s]+\.md)\s*([✅❌])?")
+_DIR_RE = re.compile(r"📁\s+(\S+/)")
+_DOC_RE = re.compile(r"📄\s+(\S+\.md)")
+
+# Markdown patterns
+# Only links to .md targets match; any "#fragment" is left out of the captured path
+_MD_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)#]+\.md)(?:#[^)]*)?\)")
+# Same pattern over raw UTF-8; the delimiters are ASCII and never occur inside multi-byte sequences
+_MD_LINK_RE_B = re.compile(_MD_LINK_RE.pattern.encode())
+_ANCHOR_CLEAN_RE = re.compile(r"[^\w\-]")
+
+# Coherence patterns
+_SECTION_REF_RE = re.compile(r"\[[^\]]+\]\(#([^)]+)\)")
+_HEADING_RE = re.compile(r"^#+\s+(.+)$", re.MULTILINE)
+_TODO_RE = re.compile(r"(TODO|FIXME|XXX):\s*(.+)")
+_PLACEHOLDER_RE = re.compile(r"\[([^\]]*(?:PLACEHOLDER|TBD|WIP)[^\]]*)\]", re.IGNORECASE)
+
+# Slug table for ASCII headings: spaces become hyphens, characters outside [\w-] are dropped
+_ASCII_SLUG_TABLE = str.maketrans(
+    {chr(c): None for c in range(128) if not (chr(c).isalnum() or chr(c) in "_- ")} | {" ": "-"}
+)
+
+
+def _heading_anchor(heading: str) -> str:
+    """Convert a heading to its anchor: lowercase, spaces to hyphens, special characters removed."""
+    anchor = heading.lower()
+    if anchor.isascii():
+        return anchor.translate(_ASCII_SLUG_TABLE)
+    return _ANCHOR_CLEAN_RE.sub("", anchor.replace(" ", "-"))
+
+
+def _coherence_issues(content: str) -> list[str]:
+    """Collect coherence issues for one document's text.
+
+    Args:
+        content: Document text
+
+    Returns:
+        Broken section references, then TODO markers, then placeholders
+    """
+    issues: list[str] = []
+
+    # Headings are only needed to check section references, so skip them without any "](#"
+    if "](#" in content:
+        heading_anchors = {_heading_anchor(heading) for heading in _HEADING_RE.findall(content)}
+        issues.extend(
+            f"Broken section reference: #{anchor}"
+            for anchor in _SECTION_REF_RE.findall(content)
+            if anchor not in heading_anchors
+        )
+
+    # Check for TODO/FIXME items
+    issues.extend(f"{marker}: {desc.strip()}" for marker, desc in _TODO_RE.findall(content))
+
+    # Check for placeholder content
+    issues.extend(f"Placeholder content: [{placeholder}]" for placeholder in _PLACEHOLDER_RE.findall(content))
+
+    return issues
+
 
 class ReferenceValidator:
     """Validates document references and links with enhanced path resolution."""
@@ -34,6 +97,96 @@ class ReferenceValidator:
         self.root_dir = root_dir or Path.cwd()
         self.reference_map_path = self.root_dir / "DOCUMENT_REFERENCE_MAP.md"
         self.enhanced_mode = enhanced_mode
+        # Normalized root with a trailing separator, for prefix tests on resolved paths
+        self._root_prefix = os.path.normpath(self.root_dir).rstrip(os.sep) + os.sep
+        # (exists, is_file) per path; the same documents are referenced many times
+        self._path_cache: dict[Path, tuple[bool, bool]] = {}
+        self._norm_cache: dict[tuple[str, Path], str] = {}
+        # Document text shared by link, cross-reference and coherence checks
+        self._content_cache: dict[Path, str] = {}
+        # Raw bytes read for link extraction, decoded on demand by _read()
+        self._raw_cache: dict[Path, bytes] = {}
+        # Root-relative POSIX paths of known documents, filled by _build_index()
+        self._doc_index: frozenset[str] = frozenset()
+        self._rel_names: dict[Path, str] = {}
+        self._active_docs: list[Path] | None = None
+        self._planning_names: frozenset[str] | None = None
+
+    def _probe_path(self, path: Path) -> tuple[bool, bool]:
+        """Return ``(exists, is_file)`` for a path, touching the filesystem only once per path."""
+        state = self._path_cache.get(path)
+        if state is None:
+            exists = path.exists()
+            state = (exists, exists and path.is_file())
+            self._path_cache[path] = state
+        return state
+
+    def _build_index(self, all_docs: list[Path]) -> None:
+        """Index discovered documents so existence checks become set lookups.
+
+        Also records each document's root-relative name so later passes do not
+        recompute it.
+
+        Args:
+            all_docs: Documents found by find_active_documents()
+        """
+        index = set()
+        for doc_path in all_docs:
+            try:
+                rel_path = doc_path.relative_to(self.root_dir)
+            except ValueError:
+                continue
+            index.add(rel_path.as_posix())
+            self._rel_names[doc_path] = sys.intern(str(rel_path))
+        self._doc_index = frozenset(index)
+
+    def _relative_name(self, doc_path: Path) -> str:
+        """Return the root-relative name of a document, computing it once per path."""
+        rel_name = self._rel_names.get(doc_path)
+        if rel_name is None:
+            rel_name = sys.intern(str(doc_path.relative_to(self.root_dir)))
+            self._rel_names[doc_path] = rel_name
+        return rel_name
+
+    def _docs(self) -> list[Path]:
+        """Return the active documents, walking the tree only on first use."""
+        if self._active_docs is None:
+            self._active_docs = find_active_documents()
+            self._build_index(self._active_docs)
+        return self._active_docs
+
+    def _planning_entries(self) -> frozenset[str]:
+        """Return the entry names directly under planning/, listing the directory only once."""
+        if self._planning_names is None:
+            try:
+                with os.scandir(self.root_dir / "planning") as it:
+                    self._planning_names = frozenset(entry.name for entry in it)
+            except OSError:
+                self._planning_names = frozenset()
+        return self._planning_names
+
+    def _document_exists(self, rel_path: str, require_file: bool = False) -> bool:
+        """Check a root-relative path against the index, probing the filesystem only on a miss."""
+        if rel_path in self._doc_index:
+            return True
+        exists, is_file = self._probe_path(self.root_dir / rel_path)
+        return is_file if require_file else exists
+
+    def _read_bytes(self, path: Path) -> bytes:
+        """Return the raw bytes of a document, reading it only once per validator."""
+        raw = self._raw_cache.get(path)
+        if raw is None:
+            raw = path.read_bytes()
+            self._raw_cache[path] = raw
+        return raw
+
+    def _read(self, path: Path) -> str:
+        """Return the text of a document, reading and decoding it only once per validator."""
+        content = self._content_cache.get(path)
+        if content is None:
+            content = self._read_bytes(path).decode("utf-8", errors="replace")
+            self._content_cache[path] = content
+        return content
 
     def normalize_path(self, path: str, from_dir: Path | None = None) -> str:
         """Normalize a path to be relative to root directory.
@@ -41,109 +194,144 @@ class ReferenceValidator:
         Enhanced mode feature for better path resolution.
         """
         if not self.enhanced_mode:
-            # Basic normalization
+            # Basic normalization; interned because the same references recur everywhere
             if path.startswith("./"):
-                return path[2:]
-            return path
+                return sys.intern(path[2:])
+            return sys.intern(path)
 
-        # Enhanced normalization
+        # Enhanced normalization, memoized: the same links recur across documents
         if from_dir is None:
             from_dir = self.root_dir
 
+        key = (path, from_dir)
+        normalized = self._norm_cache.get(key)
+        if normalized is None:
+            normalized = sys.intern(self._normalize_enhanced_path(path, from_dir))
+            self._norm_cache[key] = normalized
+        return normalized
+
+    def _normalize_enhanced_path(self, path: str, from_dir: Path) -> str:
+        """Resolve a path relative to ``from_dir`` into a root-relative path."""
         # Handle relative paths
         if path.startswith("../"):
-            # Resolve relative to the from_dir
-            resolved = (from_dir / path).resolve()
-            try:
-                return str(resolved.relative_to(self.root_dir))
-            except ValueError:
-                return path
-        elif path.startswith("./"):
-            path = path[2:]
+            # Resolve lexically relative to the from_dir; links name logical paths,
+            # so there is no need to follow symlinks on disk
+            resolved = os.path.normpath(from_dir / path)
+            if resolved.startswith(self._root_prefix):
+                return resolved[len(self._root_prefix) :]
+            if resolved == self._root_prefix[:-1]:
+                return "."
+            return path
+        path = path.removeprefix("./")
 
         # If path doesn't start with planning/ or docs/, check if it should
-        if not path.startswith(("planning/", "docs/", "../")) and (self.root_dir / "planning" / path).exists():
-            return f"planning/{path}"
+        if not path.startswith(("planning/", "docs/", "../")):
+            in_planning = (
+                self._document_exists(f"planning/{path}") if "/" in path else path in self._planning_entries()
+            )
+            if in_planning:
+                return f"planning/{path}"
 
         return path
 
     def extract_references_from_map(self) -> dict[str, list[str]]:
         """Extract all document references from DOCUMENT_REFERENCE_MAP.md."""
-        references: dict[str, list[str]] = defaultdict(list)
+        references: dict[str, list[str]] = {}
 
         if not self.reference_map_path.exists():
             logger.info(f"❌ DOCUMENT_REFERENCE_MAP.md not found at {self.reference_map_path}")
             return references
 
-        content = self.reference_map_path.read_text()
-
-        # Pattern to match document references in the map
-        # Matches lines like: │   ├── 🔗 → PLANNING.md ✅
-        ref_pattern = r"🔗 → ([^\s]+\.md)\s*([✅❌])?"
-
         current_doc = None
+        current_refs: list[str] | None = None  # references[current_doc], once created
         current_dir = self.root_dir
 
-        for line in content.split("\n"):
-            # Enhanced mode: Detect directory context
-            if self.enhanced_mode and "📁" in line and "/" in line:
-                dir_match = re.search(r"📁\s+(\S+/)", line)
-                if dir_match:
-                    current_dir = self.root_dir / dir_match.group(1).rstrip("/")
-
-            # Detect document being analyzed
-            if "📄" in line and ".md" in line:
-                doc_match = re.search(r"📄\s+(\S+\.md)", line)
-                if doc_match:
-                    current_doc = doc_match.group(1)
-                    # Enhanced mode: Normalize based on current directory context
-                    if self.enhanced_mode and current_dir != self.root_dir:
-                        rel_path = current_dir.relative_to(self.root_dir)
-                        current_doc = str(rel_path / current_doc)
-
-            # Find references from current document
-            if current_doc and "🔗" in line:
-                ref_match = re.search(ref_pattern, line)
-                if ref_match:
-                    referenced_doc = ref_match.group(1)
-                    # Normalize the referenced document path
-                    if self.enhanced_mode:
-                        normalized_ref = self.normalize_path(referenced_doc, current_dir)
-                        references[current_doc].append(normalized_ref)
-                    else:
-                        references[current_doc].append(referenced_doc)
-
-        return dict(references)
-
-    def extract_references_from_document(self, doc_path: Path) -> set[str]:
-        """Extract markdown links from a document."""
-        if not doc_path.exists():
-            return set()
-
-        content = doc_path.read_text()
-        doc_dir = doc_path.parent if self.enhanced_mode else None
+        # Stream the map; most lines are prose and carry none of the markers
+        with self.reference_map_path.open(encoding="utf-8") as map_file:
+            for raw_line in map_file:
+                # Look for each marker once; the branches below reuse the flags
+                has_dir = "📁" in raw_line
+                has_doc = "📄" in raw_line
+                has_ref = "🔗" in raw_line
+                if not (has_dir or has_doc or has_ref):
+                    continue
+                line = raw_line.rstrip("\n")
+
+                # Enhanced mode: Detect directory context
+                if has_dir and self.enhanced_mode and "/" in line:
+                    dir_match = _DIR_RE.search(line)
+                    if dir_match:
+                        current_dir = self.root_dir / dir_match.group(1).rstrip("/")
+
+                # Detect document being analyzed
+                if has_doc and ".md" in line:
+                    doc_match = _DOC_RE.search(line)
+                    if doc_match:
+                        current_doc = doc_match.group(1)
+                        current_refs = None
+                        # Enhanced mode: Normalize based on current directory context
+                        if self.enhanced_mode and current_dir != self.root_dir:
+                            rel_path = current_dir.relative_to(self.root_dir)
+                            current_doc = str(rel_path / current_doc)
+                        current_doc = sys.intern(current_doc)
+
+                # Find references from current document
+                if has_ref and current_doc:
+                    ref_match = _REF_RE.search(line)
+                    if ref_match:
+                        referenced_doc = ref_match.group(1)
+                        if current_refs is None:
+                            current_refs = references.setdefault(current_doc, [])
+                        # Normalize the referenced document path
+                        if self.enhanced_mode:
+                            normalized_ref = self.normalize_path(referenced_doc, current_dir)
+                            current_refs.append(normalized_ref)
+                        else:
+                            current_refs.append(sys.intern(referenced_doc))
 
-        # Pattern to match markdown links: [text](path)
-        link_pattern = r"\[([^\]]+)\]\(([^)]+)\)"
+        return references
 
-        references = set()
-        for match in re.finditer(link_pattern, content):
-            link_path = match.group(2)
+    def extract_references_from_document(self, doc_path: Path, content: str | None = None) -> set[str]:
+        """Extract markdown links from a document.
 
-            # Only consider .md files
-            if link_path.endswith(".md"):
-                if self.enhanced_mode:
-                    # Normalize path relative to document location
-                    normalized = self.normalize_path(link_path, doc_dir)
-                    references.add(normalized)
-                else:
-                    # Basic normalization
-                    if link_path.startswith("./"):
-                        link_path = link_path[2:]
-                    references.add(link_path)
+        Args:
+            doc_path: Path to the document
+            content: Already loaded document text; read from ``doc_path`` when omitted
+        """
+        if content is None:
+            content = self._content_cache.get(doc_path)
+        if content is None:
+            if not self._probe_path(doc_path)[0]:
+                return set()
+            # Links only need ASCII structure: scan the raw bytes and decode just the targets
+            link_paths = self._link_targets(self._read_bytes(doc_path))
+        elif ".md" in content:
+            link_paths = [match.group(2) for match in _MD_LINK_RE.finditer(content)]
+        else:
+            link_paths = []
+
+        references: set[str] = set()
+        doc_dir = doc_path.parent if self.enhanced_mode else None
+
+        for link_path in link_paths:
+            if self.enhanced_mode:
+                # Normalize path relative to document location
+                normalized = self.normalize_path(link_path, doc_dir)
+                references.add(normalized)
+            else:
+                # Basic normalization
+                relative = link_path.removeprefix("./")
+                references.add(sys.intern(relative))
 
         return references
 
+    @staticmethod
+    def _link_targets(raw: bytes) -> list[str]:
+        """Return the .md link targets in undecoded document bytes."""
+        if b".md" not in raw:
+            return []
+        return [match.group(2).decode("utf-8", errors="replace") for match in _MD_LINK_RE_B.finditer(raw)]
+
     def validate_document_presence(self, references: dict[str, list[str]]) -> dict[str, bool]:
         """Check if all referenced documents exist."""
         presence_status = {}
@@ -156,16 +344,18 @@ class ReferenceValidator:
                     normalized_ref = ref[2:]
 
                 # Check if file exists
-                full_path = self.root_dir / (normalized_ref if self.enhanced_mode else ref)
-                exists = full_path.exists() and full_path.is_file()
-
-                presence_status[ref] = exists
+                presence_status[ref] = self._document_exists(normalized_ref, require_file=True)
 
         return presence_status
 
-    def validate_link_correctness(self) -> dict[str, dict[str, Any]]:
-        """Validate that links in documents match the reference map."""
-        all_docs = find_active_documents()
+    def validate_link_correctness(self, all_docs: list[Path] | None = None) -> dict[str, dict[str, Any]]:
+        """Validate that links in documents match the reference map.
+
+        Args:
+            all_docs: Active documents to check; discovered once per validator when omitted
+        """
+        if all_docs is None:
+            all_docs = self._docs()
         link_status = {}
 
         for doc_path in all_docs:
@@ -177,20 +367,26 @@ class ReferenceValidator:
             actual_refs = self.extract_references_from_document(doc_path)
 
             # Get relative path for the document
-            doc_name = str(doc_path.relative_to(self.root_dir)) if self.enhanced_mode else doc_path.name
+            rel_name = self._relative_name(doc_path)
+            doc_name = rel_name if self.enhanced_mode else doc_path.name
 
             link_status[doc_name] = {
-                "path": str(doc_path.relative_to(self.root_dir)),
+                "path": rel_name,
                 "references": list(actual_refs),
                 "reference_count": len(actual_refs),
             }
 
         return link_status
 
-    def check_internal_coherence(self) -> dict[str, list[str]]:
-        """Check for internal coherence issues in documents."""
-        issues = defaultdict(list)
-        all_docs = find_active_documents()
+    def check_internal_coherence(self, all_docs: list[Path] | None = None) -> dict[str, list[str]]:
+        """Check for internal coherence issues in documents.
+
+        Args:
+            all_docs: Active documents to check; discovered once per validator when omitted
+        """
+        issues: dict[str, list[str]] = {}
+        if all_docs is None:
+            all_docs = self._docs()
 
         for doc_path in all_docs:
             doc_name = doc_path.name
@@ -198,64 +394,53 @@ class ReferenceValidator:
             if not doc_name.endswith(".md"):
                 continue
 
+            # Read through the content cache shared with the other checks
             try:
-                content = doc_path.read_text()
+                content = self._read(doc_path)
             except OSError as e:
-                issues[doc_name].append(f"Error reading file: {e}")
-                continue
+                doc_issues = [f"Error reading file: {e}"]
+            else:
+                doc_issues = _coherence_issues(content)
+
+            if doc_issues:
+                existing = issues.get(doc_name)
+                if existing is None:
+                    issues[doc_name] = doc_issues
+                else:
+                    existing.extend(doc_issues)
 
-            # Check for broken section references
-            section_refs = re.findall(r"\[([^\]]+)\]\(#([^)]+)\)", content)
-            headings = re.findall(r"^#+\s+(.+)$", content, re.MULTILINE)
-
-            # Normalize headings to anchor format
-            heading_anchors = set()
-            for heading in headings:
-                # Convert to lowercase and replace spaces with hyphens
-                anchor = heading.lower().replace(" ", "-")
-                # Remove special characters
-                anchor = re.sub(r"[^\w\-]", "", anchor)
-                heading_anchors.add(anchor)
-
-            # Check section references
-            for _ref_text, anchor in section_refs:
-                if anchor not in heading_anchors:
-                    issues[doc_name].append(f"Broken section reference: #{anchor}")
-
-            # Check for TODO/FIXME items
-            todos = re.findall(r"(TODO|FIXME|XXX):\s*(.+)", content)
-            for marker, desc in todos:
-                issues[doc_name].append(f"{marker}: {desc.strip()}")
-
-            # Check for placeholder content
-            placeholders = re.findall(r"\[([^\]]*(?:PLACEHOLDER|TBD|WIP)[^\]]*)\]", content, re.IGNORECASE)
-            for placeholder in placeholders:
-                issues[doc_name].append(f"Placeholder content: [{placeholder}]")
-
-        return dict(issues)
-
-    def validate_cross_references(self) -> dict[str, list[str]]:
-        """Validate cross-references between documents (enhanced mode feature)."""
+        return issues
+
+    def validate_cross_references(self, all_docs: list[Path] | None = None) -> dict[str, list[str]]:
+        """Validate cross-references between documents (enhanced mode feature).
+
+        Args:
+            all_docs: Active documents to check; discovered once per validator when omitted
+        """
         if not self.enhanced_mode:
             return {}
 
-        all_docs = find_active_documents()
-        invalid_refs = defaultdict(list)
+        if all_docs is None:
+            all_docs = self._docs()
+        invalid_refs: dict[str, list[str]] = {}
 
         for doc_path in all_docs:
             if not doc_path.name.endswith(".md"):
                 continue
 
             doc_refs = self.extract_references_from_document(doc_path)
-            doc_name = str(doc_path.relative_to(self.root_dir))
+            doc_name = self._relative_name(doc_path)
 
             # Check each reference
-            for ref in doc_refs:
-                ref_path = self.root_dir / ref
-                if not ref_path.exists():
-                    invalid_refs[doc_name].append(ref)
+            missing = [ref for ref in doc_refs if not self._document_exists(ref)]
+            if missing:
+                existing = invalid_refs.get(doc_name)
+                if existing is None:
+                    invalid_refs[doc_name] = missing
+                else:
+                    existing.extend(missing)
 
-        return dict(invalid_refs)
+        return invalid_refs
 
     def generate_validation_report(self) -> None:  # noqa: PLR0914
         """Generate a comprehensive validation report."""
@@ -263,48 +448,58 @@ class ReferenceValidator:
             "ENHANCED DOCUMENT REFERENCE VALIDATION REPORT" if self.enhanced_mode else "DOCUMENT REFERENCE VALIDATION REPORT"
         )
 
-        logger.info("=" * 80)
-        logger.info(f"📊 {report_title}")
-        logger.info("=" * 80)
-        logger.info("")
+        # Buffer each section and log it as one record instead of one call per line
+        lines: list[str] = []
+        out = lines.append
+
+        out("=" * 80)
+        out(f"📊 {report_title}")
+        out("=" * 80)
+        out("")
 
         # 1. Extract references from map
-        logger.info("1️⃣ EXTRACTING REFERENCES FROM DOCUMENT_REFERENCE_MAP.md")
-        logger.info("-" * 50)
+        out("1️⃣ EXTRACTING REFERENCES FROM DOCUMENT_REFERENCE_MAP.md")
+        out("-" * 50)
+        self._flush_report(lines)
         references = self.extract_references_from_map()
 
         if not references:
-            logger.info("❌ No references found or file missing")
+            out("❌ No references found or file missing")
+            self._flush_report(lines)
             return
 
         total_refs = sum(len(refs) for refs in references.values())
-        logger.info(f"✅ Found {len(references)} documents with {total_refs} total references")
-        logger.info("")
+        out(f"✅ Found {len(references)} documents with {total_refs} total references")
+        out("")
+
+        # Discover documents once; the index answers most existence checks and
+        # the list is shared with every per-document check below
+        all_docs = self._docs()
 
         # 2. Validate document presence
-        logger.info("2️⃣ VALIDATING DOCUMENT PRESENCE")
-        logger.info("-" * 50)
+        out("2️⃣ VALIDATING DOCUMENT PRESENCE")
+        out("-" * 50)
+        self._flush_report(lines)
         presence_status = self.validate_document_presence(references)
 
         missing_count = sum(1 for exists in presence_status.values() if not exists)
         present_count = len(presence_status) - missing_count
 
-        logger.info(f"✅ Present: {present_count} documents")
-        logger.info(f"❌ Missing: {missing_count} documents")
+        out(f"✅ Present: {present_count} documents")
+        out(f"❌ Missing: {missing_count} documents")
 
         if missing_count > 0:
-            logger.info("\nMissing documents:")
-            for doc, exists in sorted(presence_status.items()):
-                if not exists:
-                    logger.info(f"  ❌ {doc}")
-        logger.info("")
+            out("\nMissing documents:")
+            for doc in sorted(doc for doc, exists in presence_status.items() if not exists):
+                out(f"  ❌ {doc}")
+        out("")
 
         # 3. Enhanced mode: Path resolution analysis
         if self.enhanced_mode:
-            logger.info("3️⃣ PATH RESOLUTION ANALYSIS")
-            logger.info("-" * 50)
+            out("3️⃣ PATH RESOLUTION ANALYSIS")
+            out("-" * 50)
 
-            logger.info("Path mappings:")
+            out("Path mappings:")
             path_examples = [
                 ("CLAUDE.md", "From root", "CLAUDE.md"),
                 ("../CLAUDE.md", "From planning/", "CLAUDE.md"),
@@ -313,23 +508,24 @@ class ReferenceValidator:
             ]
 
             for original, context, resolved in path_examples:
-                logger.info(f"  {original:20} ({context:15}) → {resolved}")
-            logger.info("")
+                out(f"  {original:20} ({context:15}) → {resolved}")
+            out("")
 
         # 4. Validate link correctness
         step_num = "4️⃣" if self.enhanced_mode else "3️⃣"
-        logger.info(f"{step_num} VALIDATING LINK CORRECTNESS")
-        logger.info("-" * 50)
-        link_status = self.validate_link_correctness()
+        out(f"{step_num} VALIDATING LINK CORRECTNESS")
+        out("-" * 50)
+        self._flush_report(lines)
+        link_status = self.validate_link_correctness(all_docs)
 
         docs_with_refs = sum(1 for info in link_status.values() if int(info["reference_count"]) > 0)
         total_links = sum(int(info["reference_count"]) for info in link_status.values())
 
-        logger.info(f"📄 Analyzed {len(link_status)} documents")
-        logger.info(f"🔗 Found {total_links} total links in {docs_with_refs} documents")
+        out(f"📄 Analyzed {len(link_status)} documents")
+        out(f"🔗 Found {total_links} total links in {docs_with_refs} documents")
 
         # Compare with reference map
-        logger.info("\nCross-validation with reference map:")
+        out("\nCross-validation with reference map:")
         issues_found = False
 
         for doc, refs in references.items():
@@ -342,76 +538,87 @@ class ReferenceValidator:
 
                 if missing_in_doc or extra_in_doc:
                     issues_found = True
-                    logger.info(f"\n📄 {doc}:")
+                    out(f"\n📄 {doc}:")
                     if missing_in_doc:
-                        logger.info(f"  ⚠️  Missing links: {', '.join(missing_in_doc)}")
+                        out(f"  ⚠️  Missing links: {', '.join(missing_in_doc)}")
                     if extra_in_doc:
-                        logger.info(f"  + Extra links: {', '.join(extra_in_doc)}")
+                        out(f"  + Extra links: {', '.join(extra_in_doc)}")
 
         if not issues_found:
-            logger.info("✅ All links match the reference map!")
-        logger.info("")
+            out("✅ All links match the reference map!")
+        out("")
 
         # 5. Enhanced mode: Cross-reference validation
         if self.enhanced_mode:
-            logger.info("5️⃣ CROSS-REFERENCE VALIDATION")
-            logger.info("-" * 50)
+            out("5️⃣ CROSS-REFERENCE VALIDATION")
+            out("-" * 50)
+            self._flush_report(lines)
 
-            invalid_refs = self.validate_cross_references()
+            invalid_refs = self.validate_cross_references(all_docs)
             if invalid_refs:
-                logger.info("Documents with invalid references:")
+                out("Documents with invalid references:")
                 for doc, refs in invalid_refs.items():
-                    logger.info(f"\n📄 {doc}:")
+                    out(f"\n📄 {doc}:")
                     for ref in refs:
-                        logger.info(f"  ❌ {ref}")
+                        out(f"  ❌ {ref}")
             else:
-                logger.info("✅ All document references are valid!")
-            logger.info("")
+                out("✅ All document references are valid!")
+            out("")
 
         # 6. Check internal coherence
         step_num = "6️⃣" if self.enhanced_mode else "4️⃣"
-        logger.info(f"{step_num} CHECKING INTERNAL COHERENCE")
-        logger.info("-" * 50)
-        coherence_issues = self.check_internal_coherence()
+        out(f"{step_num} CHECKING INTERNAL COHERENCE")
+        out("-" * 50)
+        self._flush_report(lines)
+        coherence_issues = self.check_internal_coherence(all_docs)
 
         if not coherence_issues:
-            logger.info("✅ No internal coherence issues found!")
+            out("✅ No internal coherence issues found!")
         else:
-            logger.info(f"⚠️  Found issues in {len(coherence_issues)} documents:")
-            for doc, issues in sorted(coherence_issues.items())[:5]:  # Show first 5 docs
-                logger.info(f"\n📄 {doc}:")
+            out(f"⚠️  Found issues in {len(coherence_issues)} documents:")
+            # Show first 5 docs; partial selection instead of sorting every document
+            for doc, issues in heapq.nsmallest(5, coherence_issues.items(), key=itemgetter(0)):
+                out(f"\n📄 {doc}:")
                 for issue in issues[:3]:  # Show first 3 issues per doc
-                    logger.info(f"  - {issue}")
+                    out(f"  - {issue}")
                 if len(issues) > 3:
-                    logger.info(f"  ... and {len(issues) - 3} more issues")
-        logger.info("")
+                    out(f"  ... and {len(issues) - 3} more issues")
+        out("")
 
         # Summary
-        logger.info("=" * 80)
-        logger.info("📊 SUMMARY")
-        logger.info("=" * 80)
+        out("=" * 80)
+        out("📊 SUMMARY")
+        out("=" * 80)
 
         # Calculate scores
         presence_score = (present_count / len(presence_status) * 100) if presence_status else 0
-        all_docs = find_active_documents()
 
-        logger.info(f"✅ Document Presence: {presence_score:.1f}% ({present_count}/{len(presence_status)})")
-        logger.info(f"📄 Total Documents Analyzed: {len(all_docs)}")
-        logger.info(f"🔗 Total Document Links: {total_links}")
-        logger.info(f"⚠️  Documents with Issues: {len(coherence_issues)}")
+        out(f"✅ Document Presence: {presence_score:.1f}% ({present_count}/{len(presence_status)})")
+        out(f"📄 Total Documents Analyzed: {len(all_docs)}")
+        out(f"🔗 Total Document Links: {total_links}")
+        out(f"⚠️  Documents with Issues: {len(coherence_issues)}")
 
         # Overall health assessment
         invalid_ref_count = len(invalid_refs) if self.enhanced_mode else 0
 
         if presence_score >= 90 and len(coherence_issues) <= 2 and invalid_ref_count == 0:
-            logger.info("\n✅ Overall: EXCELLENT - Documentation is well-maintained")
+            out("\n✅ Overall: EXCELLENT - Documentation is well-maintained")
         elif presence_score >= 70 and len(coherence_issues) <= 5:
-            logger.info("\n⚠️  Overall: GOOD - Minor improvements needed")
+            out("\n⚠️  Overall: GOOD - Minor improvements needed")
         else:
-            logger.info("\n❌ Overall: NEEDS ATTENTION - Significant issues found")
+            out("\n❌ Overall: NEEDS ATTENTION - Significant issues found")
 
         if self.enhanced_mode:
-            logger.info("\n💡 Note: Enhanced mode with improved path resolution enabled")
+            out("\n💡 Note: Enhanced mode with improved path resolution enabled")
+
+        self._flush_report(lines)
+
+    @staticmethod
+    def _flush_report(lines: list[str]) -> None:
+        """Log buffered report lines as a single record and empty the buffer."""
+        if lines:
+            logger.info("\n".join(lines))
+            lines.clear()
 
 
 def main() -> None:
@@ -1,15 +1,18 @@
 """Document analysis reporting and content embedding verification."""
 
+import functools
+import hashlib
 import logging
 import re
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
+import numpy as np
 import pandas as pd
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 # Import markdown analyzer if available
-from .markdown_analyzer import MarkdownAnalyzer, compare_markdown_blocks
+from .markdown_analyzer import MarkdownAnalyzer, MarkdownBlock, compare_markdown_blocks
 from .similarity.semantic_similarity import analyze_active_document_similarities, analyze_semantic_similarity
 
 if TYPE_CHECKING:
@@ -17,6 +20,43 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Blank (or whitespace-only) lines separating content sections
+_SECTION_RE = re.compile(r"\n\s*\n")
+
+# Largest heatmap that still gets a text label in every cell
+_HEATMAP_ANNOTATE_MAX_DOCS = 50
+
+# Cost model for _find_embedded_sections, in characters of a plain substring search
+# (measured with pyahocorasick 2.3): one automaton scan of content costs about 48
+# searches, and building the automaton about 320 per character of its sections
+_AHOCORASICK_SCAN_COST = 48
+_AHOCORASICK_BUILD_COST = 320
+
+
+@functools.lru_cache(maxsize=512)
+def _read_document(path_str: str) -> str:
+    """Read a document once; matched files usually pair with several candidates."""
+    return Path(path_str).read_text(encoding="utf-8", errors="ignore")
+
+
+@functools.lru_cache(maxsize=1)
+def _markdown_analyzer() -> MarkdownAnalyzer:
+    """Return a shared analyzer so the mistune parser is built once per process."""
+    return MarkdownAnalyzer()
+
+
+def _content_digest(content: str) -> bytes:
+    """Return the 16-byte blake2b digest identifying a document's content."""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+
+def _markdown_blocks(content: str, digest: bytes, block_cache: dict[bytes, list[MarkdownBlock]]) -> list[MarkdownBlock]:
+    """Extract markdown blocks once per content digest; callers must not mutate the list."""
+    blocks = block_cache.get(digest)
+    if blocks is None:
+        blocks = block_cache[digest] = _markdown_analyzer().extract_blocks(content)
+    return blocks
+
 
 def _analyze_markdown_content(
     not_in_use_content: str,
@@ -25,13 +65,13 @@ def _analyze_markdown_content(
     not_in_use_path: str,
     matched_path: str,
     similarity: float,
+    digests: tuple[bytes, bytes],
+    block_cache: dict[bytes, list[MarkdownBlock]],
 ) -> dict[str, Any]:
     """Analyze content using markdown-aware comparison."""
-    analyzer = MarkdownAnalyzer()
-
     # Extract markdown blocks
-    source_blocks = analyzer.extract_blocks(not_in_use_content)
-    target_blocks = analyzer.extract_blocks(matched_content)
+    source_blocks = _markdown_blocks(not_in_use_content, digests[0], block_cache)
+    target_blocks = _markdown_blocks(matched_content, digests[1], block_cache)
 
     # Compare blocks
     block_comparison = compare_markdown_blocks(source_blocks, target_blocks, fuzzy_threshold=0.8)
@@ -57,20 +97,50 @@ def _analyze_markdown_content(
         "analysis_mode": "markdown-aware",
     }
 
-    # Log markdown-aware results
-    logger.info("📄 %s → %s [Markdown-aware]", not_in_use_path, matched_path)
-    logger.info("   Similarity: %.2f", similarity)
-    logger.info("   Blocks matched: %d/%d", exact_matches + fuzzy_matches_md, total_blocks)
-    logger.info("   Match rate: %.1f%%", weighted_score * 100)
-    logger.info("   💡 Recommendation: %s", result["recommendation"])
-
     return result
 
 
+def _sorted_tokens(text: str) -> str:
+    """Return text's whitespace tokens sorted and re-joined, as token_sort_ratio compares them."""
+    return " ".join(sorted(text.split()))
+
+
+def _find_embedded_sections(sections: list[str], content: str) -> list[bool]:
+    """Report which sections occur verbatim in content.
+
+    With pyahocorasick installed (the ``ahocorasick`` extra), enough sections
+    over a long enough content are matched in a single automaton pass instead
+    of one substring search per section.
+
+    Args:
+        sections: Non-empty candidate sections
+        content: Text to search
+
+    Returns:
+        One flag per section, True when it occurs in content
+    """
+    build_cost = _AHOCORASICK_BUILD_COST * sum(map(len, sections))
+    if (len(sections) - _AHOCORASICK_SCAN_COST) * len(content) <= build_cost:
+        return [section in content for section in sections]
+
+    try:
+        import ahocorasick
+    except ImportError:
+        return [section in content for section in sections]
+
+    automaton = ahocorasick.Automaton()
+    for section in set(sections):
+        automaton.add_word(section, section)
+    automaton.make_automaton()
+
+    found = {section for _end, section in automaton.iter(content)}
+    return [section in found for section in sections]
+
+
 def _calculate_section_matches(
-    sections: list[str], matched_content: str, matched_sections: list[str], min_length: int
+    sections: list[str], matched_content: str, matched_sections: list[str]
 ) -> tuple[int, list[tuple[str, float]], list[tuple[str, float]]]:
-    """Calculate exact, fuzzy, and partial matches for sections."""
+    """Calculate exact, fuzzy, and partial matches for sections already filtered by length."""
     embedded_sections = 0
     fuzzy_matches: list[tuple[str, float]] = []
     partial_matches: list[tuple[str, float]] = []
@@ -78,30 +148,56 @@ def _calculate_section_matches(
     # Matching thresholds
     thresholds = {"exact": 95, "fuzzy": 80, "partial": 70}
 
-    for section in sections:
-        if len(section) >= min_length:
-            if section in matched_content:
-                embedded_sections += 1
-            else:
-                best_score = (
-                    max(
-                        max(fuzz.token_set_ratio(section, target), fuzz.token_sort_ratio(section, target))
-                        for target in matched_sections
-                    )
-                    if matched_sections
-                    else 0
-                )
+    # Sections found verbatim need no fuzzy scoring
+    unmatched: list[str] = []
+    for section, embedded in zip(sections, _find_embedded_sections(sections, matched_content), strict=True):
+        if embedded:
+            embedded_sections += 1
+        else:
+            unmatched.append(section)
+
+    if not unmatched:
+        return embedded_sections, fuzzy_matches, partial_matches
+
+    # Score every remaining section against every target in native code, keeping the best of both scorers.
+    # Neither scorer dominates the other, and WRatio rescales both (and is slower here), so both stay.
+    if matched_sections:
+        set_scores = process.cdist(unmatched, matched_sections, scorer=fuzz.token_set_ratio, dtype=np.float64, workers=-1)
+        # token_sort_ratio is ratio over sorted tokens; sort each string once instead of per pair
+        sort_scores = process.cdist(
+            [_sorted_tokens(section) for section in unmatched],
+            [_sorted_tokens(section) for section in matched_sections],
+            scorer=fuzz.ratio,
+            dtype=np.float64,
+            workers=-1,
+        )
+        best_scores = np.maximum(set_scores, sort_scores).max(axis=1).tolist()
+    else:
+        best_scores = [0.0] * len(unmatched)
 
-                if best_score >= thresholds["exact"]:
-                    embedded_sections += 1
-                elif best_score >= thresholds["fuzzy"]:
-                    fuzzy_matches.append((section[:50] + "...", best_score))
-                elif best_score >= thresholds["partial"]:
-                    partial_matches.append((section[:50] + "...", best_score))
+    for section, best_score in zip(unmatched, best_scores, strict=True):
+        if best_score >= thresholds["exact"]:
+            embedded_sections += 1
+        elif best_score >= thresholds["fuzzy"]:
+            fuzzy_matches.append((section[:50] + "...", best_score))
+        elif best_score >= thresholds["partial"]:
+            partial_matches.append((section[:50] + "...", best_score))
 
     return embedded_sections, fuzzy_matches, partial_matches
 
 
+def _split_sections(content: str) -> list[str]:
+    """Split content on blank lines into stripped, non-empty sections.
+
+    Args:
+        content: Text to split
+
+    Returns:
+        Non-empty sections with surrounding whitespace removed
+    """
+    return [stripped for part in _SECTION_RE.split(content) if (stripped := part.strip())]
+
+
 def _analyze_traditional_content(
     not_in_use_content: str,
     matched_content: str,
@@ -112,18 +208,16 @@ def _analyze_traditional_content(
     min_section_length: int,
 ) -> dict[str, Any]:
     """Analyze content using traditional section-based comparison."""
-    # Split into sections
-    not_in_use_sections = [s.strip() for s in re.split(r"\n\s*\n", not_in_use_content) if s.strip()]
-    matched_sections = [
-        s.strip() for s in re.split(r"\n\s*\n", matched_content) if s.strip() and len(s.strip()) >= min_section_length
-    ]
+    # Split into sections, applying the length filter once for both documents
+    not_in_use_sections = [s for s in _split_sections(not_in_use_content) if len(s) >= min_section_length]
+    matched_sections = [s for s in _split_sections(matched_content) if len(s) >= min_section_length]
 
     # Calculate matches using helper function
     embedded_sections, fuzzy_matches, partial_matches = _calculate_section_matches(
-        not_in_use_sections, matched_content, matched_sections, min_section_length
+        not_in_use_sections, matched_content, matched_sections
     )
 
-    total_sections = len([s for s in not_in_use_sections if len(s) >= min_section_length])
+    total_sections = len(not_in_use_sections)
 
     # Calculate ratios
     embedding_ratio = embedded_sections / total_sections if total_sections > 0 else 0
@@ -147,16 +241,86 @@ def _analyze_traditional_content(
         "analysis_mode": "traditional",
     }
 
-    # Log results
-    logger.info("📄 %s → %s", not_in_use_path, matched_path)
-    logger.info("   Similarity: %.2f", similarity)
-    logger.info("   Exact/Near-exact: %d/%d sections (%.0f%%)", embedded_sections, total_sections, embedding_ratio * 100)
-    logger.info("   Fuzzy matches: %d (80-95%% similar)", len(fuzzy_matches))
-    logger.info("   Partial matches: %d (70-80%% similar)", len(partial_matches))
-    logger.info("   Weighted score: %.2f", weighted_score)
+    return result
+
+
+def _log_analysis(result: dict[str, Any]) -> None:
+    """Log one pair's embedding analysis from the fields of its result."""
+    if result["analysis_mode"] == "markdown-aware":
+        logger.info("📄 %s → %s [Markdown-aware]", result["not_in_use"], result["matched"])
+        logger.info("   Similarity: %.2f", result["similarity"])
+        logger.info(
+            "   Blocks matched: %d/%d", result["embedded_sections"] + result["fuzzy_matches"], result["total_sections"]
+        )
+        logger.info("   Match rate: %.1f%%", result["weighted_score"] * 100)
+    else:
+        logger.info("📄 %s → %s", result["not_in_use"], result["matched"])
+        logger.info("   Similarity: %.2f", result["similarity"])
+        logger.info(
+            "   Exact/Near-exact: %d/%d sections (%.0f%%)",
+            result["embedded_sections"],
+            result["total_sections"],
+            result["embedding_ratio"] * 100,
+        )
+        logger.info("   Fuzzy matches: %d (80-95%% similar)", result["fuzzy_matches"])
+        logger.info("   Partial matches: %d (70-80%% similar)", result["partial_matches"])
+        logger.info("   Weighted score: %.2f", result["weighted_score"])
     logger.info("   💡 Recommendation: %s", result["recommendation"])
 
-    return result
+
+def _analyze_pair(
+    not_in_use_content: str,
+    matched_content: str,
+    *,
+    not_in_use_path: str,
+    matched_path: str,
+    similarity: float,
+    min_section_length: int,
+    use_markdown: bool,
+    digests: tuple[bytes, bytes],
+    block_cache: dict[bytes, list[MarkdownBlock]],
+) -> dict[str, Any]:
+    """Analyze one not_in_use/matched pair, preferring markdown-aware comparison.
+
+    Args:
+        not_in_use_content: Text of the not_in_use document
+        matched_content: Text of the matched document
+        not_in_use_path: Path of the not_in_use document, as reported
+        matched_path: Path of the matched document, as reported
+        similarity: Similarity score of the pair
+        min_section_length: Minimum section length for section-based analysis
+        use_markdown: Use markdown-aware comparison for markdown pairs
+        digests: Content digests of the not_in_use and matched documents
+        block_cache: Markdown blocks by content digest, shared across pairs
+
+    Returns:
+        Embedding analysis result for the pair, which _log_analysis reports
+    """
+    # Try markdown-aware analysis first if available
+    if use_markdown and not_in_use_path.endswith(".md") and matched_path.endswith(".md"):
+        try:
+            return _analyze_markdown_content(
+                not_in_use_content,
+                matched_content,
+                not_in_use_path=not_in_use_path,
+                matched_path=matched_path,
+                similarity=similarity,
+                digests=digests,
+                block_cache=block_cache,
+            )
+        except (ValueError, AttributeError, TypeError) as e:
+            # Fall back to traditional analysis
+            logger.warning("⚠️  Markdown analysis failed, using traditional method: %s", e)
+
+    # Traditional section-based analysis
+    return _analyze_traditional_content(
+        not_in_use_content,
+        matched_content,
+        not_in_use_path=not_in_use_path,
+        matched_path=matched_path,
+        similarity=similarity,
+        min_section_length=min_section_length,
+    )
 
 
 def check_content_embedding(
@@ -187,52 +351,62 @@ def check_content_embedding(
     logger.info("Checking if not_in_use content exists in matched files...")
     logger.info("Minimum section length: %d characters", min_section_length)
 
-    # Filter by similarity threshold
-    filtered_df = similarity_df[similarity_df["similarity"] >= similarity_threshold].copy()
+    # Filter by similarity threshold, keeping only the columns read below (nothing here mutates the slice)
+    mask = similarity_df["similarity"].to_numpy() >= similarity_threshold
+    filtered_df = similarity_df.loc[mask, ["not_in_use", "matched_file", "similarity"]]
+
+    # Probe each distinct file once; a matched file usually pairs with several candidates
+    unique_paths = pd.unique(filtered_df[["not_in_use", "matched_file"]].to_numpy().ravel())
+    path_exists = {path: (root_dir / path).exists() for path in unique_paths}
 
+    # Copy-pasted documents share content; analyze each distinct content pair once
+    digests: dict[str, bytes] = {}
+    analyses: dict[tuple[bytes, bytes, bool], dict[str, Any]] = {}
+    # Parse each distinct document's markdown once; the cache lives only for this call
+    block_cache: dict[bytes, list[MarkdownBlock]] = {}
     results = []
-    for _, row in filtered_df.iterrows():
-        not_in_use_path = row["not_in_use"]
-        matched_path = row["matched_file"]
-        similarity = row["similarity"]
-
-        # Read both files
-        not_in_use_full_path = root_dir / not_in_use_path
-        matched_full_path = root_dir / matched_path
-
-        if not not_in_use_full_path.exists() or not matched_full_path.exists():
-            logger.warning("⚠️  File not found: %s or %s", not_in_use_path, matched_path)
-            continue
-
-        not_in_use_content = not_in_use_full_path.read_text(encoding="utf-8", errors="ignore")
-        matched_content = matched_full_path.read_text(encoding="utf-8", errors="ignore")
-
-        # Try markdown-aware analysis first if available
-        if use_markdown_aware and not_in_use_path.endswith(".md") and matched_path.endswith(".md"):
-            try:
-                result = _analyze_markdown_content(
+    try:
+        for row in filtered_df.itertuples(index=False):
+            not_in_use_path = row.not_in_use
+            matched_path = row.matched_file
+            similarity = row.similarity
+
+            if not path_exists[not_in_use_path] or not path_exists[matched_path]:
+                logger.warning("⚠️  File not found: %s or %s", not_in_use_path, matched_path)
+                continue
+
+            not_in_use_content = _read_document(str(root_dir / not_in_use_path))
+            matched_content = _read_document(str(root_dir / matched_path))
+            for path, content in ((not_in_use_path, not_in_use_content), (matched_path, matched_content)):
+                if path not in digests:
+                    digests[path] = _content_digest(content)
+
+            markdown_mode = use_markdown_aware and not_in_use_path.endswith(".md") and matched_path.endswith(".md")
+            pair_digests = (digests[not_in_use_path], digests[matched_path])
+            key = (*pair_digests, markdown_mode)
+            analysis = analyses.get(key)
+            if analysis is None:
+                analysis = analyses[key] = _analyze_pair(
                     not_in_use_content,
                     matched_content,
                     not_in_use_path=not_in_use_path,
                     matched_path=matched_path,
                     similarity=similarity,
+                    min_section_length=min_section_length,
+                    use_markdown=use_markdown_aware,
+                    digests=pair_digests,
+                    block_cache=block_cache,
                 )
-                results.append(result)
-                continue  # Skip traditional analysis
-            except (ValueError, AttributeError, TypeError) as e:
-                # Fall back to traditional analysis
-                logger.warning("⚠️  Markdown analysis failed, using traditional method: %s", e)
-
-        # Traditional section-based analysis
-        result = _analyze_traditional_content(
-            not_in_use_content,
-            matched_content,
-            not_in_use_path=not_in_use_path,
-            matched_path=matched_path,
-            similarity=similarity,
-            min_section_length=min_section_length,
-        )
-        results.append(result)
+                _log_analysis(analysis)
+                results.append(analysis)
+            else:
+                logger.info("📄 %s → %s [same content as an analyzed pair]", not_in_use_path, matched_path)
+                results.append(
+                    {**analysis, "not_in_use": not_in_use_path, "matched": matched_path, "similarity": similarity}
+                )
+    finally:
+        # Files may change between runs, so never serve contents from a previous call
+        _read_document.cache_clear()
 
     # Create DataFrame from results
     result_df = pd.DataFrame(results)
@@ -303,8 +477,9 @@ def generate_comprehensive_similarity_report(
         high_concern = active_similarities[active_similarities["relationship_type"].isin(["NEAR_DUPLICATE", "HIGH_OVERLAP"])]
         if not high_concern.empty:
             logger.warning("   🚨 High concern cases: %d", len(high_concern))
-            for _, row in high_concern.head(3).iterrows():
-                logger.warning("      %s ↔ %s (%.3f)", row["doc1"], row["doc2"], row["similarity"])
+            top_concerns = high_concern[["doc1", "doc2", "similarity"]].head(3)
+            for doc1, doc2, similarity in top_concerns.itertuples(index=False, name=None):
+                logger.warning("      %s ↔ %s (%.3f)", doc1, doc2, similarity)
     else:
         logger.info("   ✅ No significant overlaps found among active documents")
 
@@ -427,15 +602,23 @@ def create_overlap_heatmap(
         # Mask values below threshold
         mask = similarity_matrix < threshold
 
-        sns.heatmap(
-            similarity_matrix,
-            mask=mask,
-            annot=True,
-            fmt=".2f",
-            cmap="Reds",
-            cbar_kws={"label": "Similarity Score"},
-            square=True,
-        )
+        if len(similarity_matrix) > _HEATMAP_ANNOTATE_MAX_DOCS:
+            # Per-cell labels are unreadable at this size; draw one raster image instead of a mesh
+            plt.imshow(similarity_matrix.where(~mask).to_numpy(dtype=float), cmap="Reds", interpolation="nearest")
+            plt.colorbar(label="Similarity Score")
+            positions = range(len(similarity_matrix))
+            plt.xticks(positions, similarity_matrix.columns)
+            plt.yticks(positions, similarity_matrix.index)
+        else:
+            sns.heatmap(
+                similarity_matrix,
+                mask=mask,
+                annot=True,
+                fmt=".2f",
+                cmap="Reds",
+                cbar_kws={"label": "Similarity Score"},
+                square=True,
+            )
 
         plt.title(f"Document Similarity Heatmap (threshold: {threshold})")
         plt.xlabel("Documents")
@@ -446,6 +629,7 @@ def create_overlap_heatmap(
 
         if output_path:
             plt.savefig(output_path, dpi=300, bbox_inches="tight")
+            plt.close()
             logger.info("📊 Heatmap saved to %s", output_path)
             return output_path
 
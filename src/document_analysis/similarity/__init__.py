@@ -10,11 +10,13 @@ a common base interface.
 """
 
 from .base import SimilarityCalculator, SimilarityMatrix, SimilarityResult
-from .matrix_utils import create_empty_matrix, find_clusters_in_matrix, normalize_matrix
+from .embedding_cache import EmbeddingCache
+from .matrix_utils import create_empty_matrix, create_empty_matrix_np, find_clusters_in_matrix, normalize_matrix
 from .semantic_similarity import SemanticSimilarityCalculator
 from .string_similarity import StringSimilarityCalculator
 
 __all__ = [
+    "EmbeddingCache",
     "SemanticSimilarityCalculator",
     # Base interfaces
     "SimilarityCalculator",
@@ -24,6 +26,7 @@ __all__ = [
     "StringSimilarityCalculator",
     # Utilities
     "create_empty_matrix",
+    "create_empty_matrix_np",
     "find_clusters_in_matrix",
     "normalize_matrix",
 ]
@@ -12,6 +12,8 @@ from typing import Any, Protocol, TypeAlias
 
 import numpy as np
 import pandas as pd
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 
 from ..validation import ValidationError
 
@@ -23,7 +25,7 @@ TextList = list[str]
 PathList = list[Path]
 
 
-@dataclass
+@dataclass(slots=True)
 class SimilarityResult:
     """Result of similarity calculation between documents.
 
@@ -46,6 +48,30 @@ class SimilarityResult:
         if not 0.0 <= self.score <= 1.0:
             raise ValueError(f"Similarity score must be between 0.0 and 1.0, got {self.score}")
 
+    @classmethod
+    def create_unchecked(
+        cls, source: str, target: str, score: float, technique: str, metadata: dict[str, Any] | None = None
+    ) -> "SimilarityResult":
+        """Create a result without validation, for pipelines whose scores are already in range.
+
+        Args:
+            source: Source document identifier
+            target: Target document identifier
+            score: Similarity score, already known to be within 0.0 to 1.0
+            technique: Similarity calculation technique used
+            metadata: Additional information about the calculation
+
+        Returns:
+            New SimilarityResult, skipping __post_init__
+        """
+        result = cls.__new__(cls)
+        result.source = source
+        result.target = target
+        result.score = score
+        result.technique = technique
+        result.metadata = {} if metadata is None else metadata
+        return result
+
 
 class SimilarityCalculator(Protocol):
     """Protocol defining the interface for similarity calculators.
@@ -160,7 +186,7 @@ class BaseSimilarityCalculator(ABC):
             logger.error(f"Similarity calculation failed: {e}")
             raise ValidationError(f"Failed to calculate similarity: {e}") from e
 
-    def calculate_matrix(self, texts: TextList, threshold: float = 0.0) -> SimilarityMatrix:
+    def calculate_matrix(self, texts: TextList, threshold: float = 0.0) -> np.ndarray:
         """Calculate pairwise similarity matrix for list of texts.
 
         Args:
@@ -168,7 +194,7 @@ class BaseSimilarityCalculator(ABC):
             threshold: Minimum similarity score to include in results
 
         Returns:
-            Similarity matrix with scores >= threshold
+            Square float32 array with scores >= threshold
 
         Raises:
             ValidationError: If input validation fails
@@ -184,25 +210,47 @@ class BaseSimilarityCalculator(ABC):
         for i, text in enumerate(texts):
             self._validate_text_input(text, f"texts[{i}]")
 
+        batch = self._calculate_batch(texts)
+        if batch is not None:
+            # Match the pairwise loop: clamp, drop scores below threshold, self-similarity 1.0
+            matrix = np.clip(np.asarray(batch, dtype=np.float32), 0.0, 1.0)
+            matrix[matrix < threshold] = 0.0
+            np.fill_diagonal(matrix, 1.0)
+            return matrix
+
         n = len(texts)
-        matrix = [[0.0 for _ in range(n)] for _ in range(n)]
+        # One zeroed float32 block instead of n lists of n boxed floats
+        matrix = np.zeros((n, n), dtype=np.float32)
+        np.fill_diagonal(matrix, 1.0)  # Self-similarity is always 1.0
 
         # Calculate pairwise similarities
         for i in range(n):
-            matrix[i][i] = 1.0  # Self-similarity is always 1.0
-
             for j in range(i + 1, n):
                 try:
                     score = self._calculate_similarity(texts[i], texts[j])
                     if score >= threshold:
-                        matrix[i][j] = score
-                        matrix[j][i] = score  # Symmetric matrix
+                        matrix[i, j] = matrix[j, i] = score  # Symmetric matrix
                 except (AttributeError, TypeError, ValueError) as e:
                     logger.warning(f"Failed to calculate similarity for texts {i}, {j}: {e}")
                     continue
 
         return matrix
 
+    def _calculate_batch(self, texts: TextList) -> np.ndarray | None:
+        """Calculate the full similarity matrix in one call (optional hook).
+
+        Subclasses with a vectorized scorer override this to skip the
+        pairwise Python loop in calculate_matrix.
+
+        Args:
+            texts: Validated list of texts to compare
+
+        Returns:
+            Square array of scores between 0.0 and 1.0, or None to fall back
+            to pairwise calculation
+        """
+        return None
+
     def _validate_text_input(self, text: str, param_name: str) -> None:
         """Validate text input parameter.
 
@@ -223,12 +271,32 @@ class BaseSimilarityCalculator(ABC):
             raise ValidationError(f"{param_name} too long: {len(text)} characters (max 100,000)")
 
 
+def clusters_from_adjacency(adjacency: csr_matrix) -> list[list[int]]:
+    """Group item indices into connected components of an adjacency matrix.
+
+    Args:
+        adjacency: Square matrix whose stored non-zero entries link items
+
+    Returns:
+        Components with more than one item, each in ascending index order,
+        ordered by their smallest index
+    """
+    _, labels = connected_components(adjacency, directed=False)
+    # scipy labels components in order of their smallest member, so a stable sort keeps both orders
+    members = np.argsort(labels, kind="stable")
+    groups = np.split(members, np.cumsum(np.bincount(labels))[:-1])
+    return [group.tolist() for group in groups if len(group) > 1]
+
+
 class ClusteringMixin:
     """Mixin providing clustering functionality for similarity matrices."""
 
     def find_clusters(self, matrix: SimilarityMatrix, threshold: float = 0.7) -> list[list[int]]:
         """Find clusters of similar items in similarity matrix.
 
+        Items are clustered transitively: if A~B and B~C, all three share a
+        cluster even when A and C fall below the threshold.
+
         Args:
             matrix: Similarity matrix (square, symmetric)
             threshold: Minimum similarity for clustering
@@ -241,46 +309,19 @@ class ClusteringMixin:
         """
         # Validate matrix
         if isinstance(matrix, list):
-            n = len(matrix)
-            if n == 0 or len(matrix[0]) != n:
+            if not matrix or len(matrix[0]) != len(matrix):
                 raise ValidationError("Matrix must be square and non-empty")
         elif isinstance(matrix, (np.ndarray, pd.DataFrame)):
             if matrix.shape[0] != matrix.shape[1]:
                 raise ValidationError("Matrix must be square")
-            n = matrix.shape[0]
         else:
             raise ValidationError(f"Unsupported matrix type: {type(matrix)}")
 
         if not 0.0 <= threshold <= 1.0:
             raise ValidationError(f"Threshold must be between 0.0 and 1.0, got {threshold}")
 
-        # Simple clustering: group items with similarity >= threshold
-        visited = [False] * n
-        clusters = []
-
-        for i in range(n):
-            if visited[i]:
-                continue
-
-            cluster = [i]
-            visited[i] = True
-
-            for j in range(i + 1, n):
-                if visited[j]:
-                    continue
-
-                # Get similarity score
-                if isinstance(matrix, list):
-                    score = matrix[i][j]
-                else:
-                    score = matrix.iloc[i, j] if isinstance(matrix, pd.DataFrame) else matrix[i, j]
-
-                if score >= threshold:
-                    cluster.append(j)
-                    visited[j] = True
-
-            if len(cluster) > 1:  # Only include clusters with multiple items
-                clusters.append(cluster)
+        # Clusters are the connected components of the thresholded similarity graph
+        clusters = clusters_from_adjacency(csr_matrix(np.asarray(matrix) >= threshold))
 
         logger.debug(f"Found {len(clusters)} clusters with threshold {threshold}")
         return clusters
@@ -0,0 +1,123 @@
+"""Persistent cache of document embeddings.
+
+Encoding text with a SentenceTransformer is the most expensive step of
+semantic similarity analysis, while document contents rarely change
+between runs. This module stores embeddings in a per-model SQLite file
+keyed by the SHA-256 of the text, so repeated runs only encode new or
+edited documents.
+"""
+
+import hashlib
+import logging
+import sqlite3
+from collections.abc import Iterable
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Literal
+
+import numpy as np
+import torch
+
+from src.document_analysis.config import EMBEDDING_CACHE_DIR
+from src.document_analysis.validation import sanitize_filename
+
+logger = logging.getLogger(__name__)
+
+# SQLite's default limit on host parameters per statement is 999
+_LOOKUP_CHUNK_SIZE = 500
+# Filled with one "?" placeholder per digest; the digests themselves are bound as parameters
+_LOOKUP_SQL = "SELECT digest, vector FROM embeddings WHERE digest IN ({})"
+
+
+class EmbeddingCache:
+    """SQLite-backed store of float32 embeddings for one model.
+
+    Example:
+        >>> cache = EmbeddingCache("sentence-transformers/all-MiniLM-L6-v2")
+        >>> embeddings = cache.encode(model, ["first text", "second text"])  # doctest: +SKIP
+    """
+
+    def __init__(self, model_name: str, cache_dir: str | Path = EMBEDDING_CACHE_DIR) -> None:
+        """Initialize the cache for a model.
+
+        Args:
+            model_name: Name of the model whose embeddings are stored
+            cache_dir: Directory holding one SQLite file per model
+        """
+        self.model_name = model_name
+        self.path = Path(cache_dir) / f"{sanitize_filename(model_name)}.sqlite3"
+
+    @staticmethod
+    def digest(text: str) -> bytes:
+        """Return the cache key of a text."""
+        return hashlib.sha256(text.encode("utf-8")).digest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache database, creating it on first use."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.execute("CREATE TABLE IF NOT EXISTS embeddings (digest BLOB PRIMARY KEY, vector BLOB NOT NULL)")
+        return conn
+
+    def lookup(self, digests: Iterable[bytes]) -> dict[bytes, np.ndarray]:
+        """Fetch cached embeddings.
+
+        Args:
+            digests: Cache keys from digest()
+
+        Returns:
+            Mapping of the keys found to their embeddings; read errors yield an empty mapping
+        """
+        keys = list(digests)
+        found: dict[bytes, np.ndarray] = {}
+        try:
+            with closing(self._connect()) as conn:
+                for start in range(0, len(keys), _LOOKUP_CHUNK_SIZE):
+                    chunk = keys[start : start + _LOOKUP_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(_LOOKUP_SQL.format(placeholders), chunk)
+                    found.update((digest, np.frombuffer(vector, dtype=np.float32)) for digest, vector in rows)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Embedding cache lookup failed for {self.path}: {e}")
+            return {}
+        return found
+
+    def store(self, embeddings: dict[bytes, np.ndarray]) -> None:
+        """Write embeddings to the cache; write errors are logged and ignored.
+
+        Args:
+            embeddings: Mapping of cache keys to embeddings
+        """
+        rows = [(digest, np.asarray(vector, dtype=np.float32).tobytes()) for digest, vector in embeddings.items()]
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.executemany("INSERT OR REPLACE INTO embeddings (digest, vector) VALUES (?, ?)", rows)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Embedding cache write failed for {self.path}: {e}")
+
+    def encode(
+        self, model: Any, texts: list[str], pool: dict[Literal["input", "output", "processes"], Any] | None = None
+    ) -> torch.Tensor:
+        """Embed texts, encoding only those not already cached.
+
+        Args:
+            model: SentenceTransformer used for cache misses
+            texts: Texts to embed
+            pool: Multi-process pool from model.start_multi_process_pool, if any
+
+        Returns:
+            Float32 tensor of embeddings in the order of texts, on the model's device
+        """
+        digests = [self.digest(text) for text in texts]
+        found = self.lookup(set(digests))
+        hits = len(found)
+
+        missing = {digest: text for digest, text in zip(digests, texts, strict=True) if digest not in found}
+        if missing:
+            vectors = model.encode(list(missing.values()), convert_to_numpy=True, show_progress_bar=False, pool=pool)
+            encoded = {digest: np.asarray(vector, dtype=np.float32) for digest, vector in zip(missing, vectors, strict=True)}
+            self.store(encoded)
+            found.update(encoded)
+
+        logger.debug(f"Embedding cache: {hits} hits, {len(missing)} encoded")
+        return torch.from_numpy(np.stack([found[digest] for digest in digests])).to(model.device)
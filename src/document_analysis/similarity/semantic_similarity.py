@@ -4,27 +4,114 @@ This module implements similarity calculation using SentenceTransformer
 for deep semantic understanding and vector-based similarity analysis.
 """
 
+import functools
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
+import numpy as np
 import pandas as pd
+import torch
 from sentence_transformers import SentenceTransformer, util
 
 from ..analyzers import load_markdown_files
 from ..config import (
     DEFAULT_MODEL_NAME,
+    DOCUMENT_CHUNK_SIZE,
+    SIMILARITY_BLOCK_ROWS,
     SIMILARITY_THRESHOLD_HIGH,
     SIMILARITY_THRESHOLD_LOW,
     SIMILARITY_THRESHOLD_MEDIUM,
 )
 from ..validation import ValidationError, validate_file_path, validate_list_input, validate_threshold
-
 from .base import BaseSimilarityCalculator, ClusteringMixin, SimilarityResult
+from .embedding_cache import EmbeddingCache
 
 logger = logging.getLogger(__name__)
 
 
+def _encode_texts(
+    model: SentenceTransformer,
+    texts: list[str],
+    cache: EmbeddingCache | None,
+    pool: dict[Literal["input", "output", "processes"], Any] | None = None,
+) -> Any:
+    """Embed texts as a tensor, through the embedding cache when one is configured.
+
+    Args:
+        model: SentenceTransformer used for encoding
+        texts: Texts to embed
+        cache: Persistent embedding cache, or None to always encode
+        pool: Multi-process pool spreading encoding over several devices, or None
+
+    Returns:
+        Embedding tensor with one row per text
+    """
+    if cache is not None:
+        return cache.encode(model, texts, pool)
+    return model.encode(texts, convert_to_tensor=True, show_progress_bar=False, pool=pool)
+
+
+def _load_model(
+    model_name: str, device: str | None, backend: Literal["torch", "onnx", "openvino"] = "torch"
+) -> SentenceTransformer:
+    """Load a SentenceTransformer model.
+
+    Raises:
+        RuntimeError: If the model cannot be loaded
+    """
+    logger.info(f"Loading SentenceTransformer model: {model_name} ({backend} backend)")
+    try:
+        return SentenceTransformer(model_name, device=device, backend=backend)
+    except (OSError, ValueError, RuntimeError) as e:
+        logger.error(f"Failed to load model {model_name}: {e}")
+        raise RuntimeError(f"Failed to load model {model_name}") from e
+
+
+# Calculators created with share_model=True reuse loaded models across calls; they never mutate them
+_shared_model = functools.lru_cache(maxsize=4)(_load_model)
+
+
+def clear_model_cache() -> None:
+    """Release models shared between calculators created with share_model=True."""
+    _shared_model.cache_clear()
+
+
+def _start_encode_pool(model: SentenceTransformer) -> dict[Literal["input", "output", "processes"], Any] | None:
+    """Start one encoding worker per CUDA device, or return None with fewer than two GPUs."""
+    if torch.cuda.device_count() < 2:
+        logger.info("Multi-GPU encoding requested but fewer than 2 CUDA devices are available")
+        return None
+    return model.start_multi_process_pool()
+
+
+def _cosine_similarity_matrix(embeddings: Any) -> np.ndarray:
+    """Compute the pairwise cosine similarity of a batch of embeddings.
+
+    Embeddings on a CUDA device are normalized and multiplied in float16,
+    SIMILARITY_BLOCK_ROWS rows at a time, so GPU memory holds one block of
+    scores instead of the full matrix; each block is copied straight into
+    the preallocated host result. CPU embeddings keep float32, where half
+    precision matmul is emulated and far slower.
+
+    Args:
+        embeddings: Embedding tensor returned by SentenceTransformer.encode
+
+    Returns:
+        Square float32 array of cosine similarities
+    """
+    if getattr(embeddings, "is_cuda", False):
+        normalized = util.normalize_embeddings(embeddings).half()
+        n = normalized.shape[0]
+        matrix = np.empty((n, n), dtype=np.float32)
+        for start in range(0, n, SIMILARITY_BLOCK_ROWS):
+            block = normalized[start : start + SIMILARITY_BLOCK_ROWS] @ normalized.T
+            matrix[start : start + block.shape[0]] = block.float().cpu().numpy()
+        return matrix
+
+    return util.pytorch_cos_sim(embeddings, embeddings).cpu().numpy().astype(np.float32, copy=False)
+
+
 class SemanticSimilarityCalculator(BaseSimilarityCalculator, ClusteringMixin):
     """Semantic similarity calculator using sentence transformers.
 
@@ -32,16 +119,81 @@ class SemanticSimilarityCalculator(BaseSimilarityCalculator, ClusteringMixin):
     cosine similarity for deep semantic understanding.
     """
 
-    def __init__(self, model_name: str = DEFAULT_MODEL_NAME, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL_NAME,
+        device: str | None = None,
+        cache_dir: str | Path | None = None,
+        precision: str = "fp32",
+        use_multi_gpu: bool = False,
+        backend: Literal["torch", "onnx", "openvino"] = "torch",
+        num_threads: int | None = None,
+        share_model: bool = False,
+        **kwargs: Any,
+    ) -> None:
         """Initialize semantic similarity calculator.
 
         Args:
             model_name: Name of the SentenceTransformer model to use
+            device: Torch device for the model (e.g. "cuda", "cpu"); None picks
+                an available GPU and falls back to CPU
+            cache_dir: Directory for persistent embeddings (e.g. config.EMBEDDING_CACHE_DIR);
+                None encodes every text on each call
+            precision: "fp32", or "fp16" to run the model in half precision on CUDA
+                (about 2x encode throughput; similarities shift by roughly 1e-3)
+            use_multi_gpu: Encode with one worker process per GPU when at least two
+                are available; call close() or use the calculator as a context
+                manager to stop the workers
+            backend: Inference backend, "torch", "onnx" or "openvino"; the latter two
+                need the matching sentence-transformers extra and export the model
+                on first load
+            num_threads: Intra-op CPU threads for torch, applied process-wide when the
+                model loads (4-8 usually encode fastest); None keeps torch's default
+            share_model: Reuse one loaded model with other sharing calculators of the
+                same model, device and backend; release it with clear_model_cache()
             **kwargs: Additional configuration parameters
         """
-        super().__init__("SemanticSimilarity", model_name=model_name, **kwargs)
+        super().__init__(
+            "SemanticSimilarity",
+            model_name=model_name,
+            device=device,
+            cache_dir=cache_dir,
+            precision=precision,
+            use_multi_gpu=use_multi_gpu,
+            backend=backend,
+            num_threads=num_threads,
+            share_model=share_model,
+            **kwargs,
+        )
         self.model_name = model_name
+        self.device = device
+        self.precision = precision
+        self.use_multi_gpu = use_multi_gpu
+        self.backend = backend
+        self.num_threads = num_threads
+        self._pool: dict[Literal["input", "output", "processes"], Any] | None = None
+        self._pool_checked = False
+        self.share_model = share_model
+
+        # Validate precision and backend choice
+        if precision not in ["fp32", "fp16"]:
+            raise ValidationError(f"Unsupported precision: {precision}")
+        if backend not in ["torch", "onnx", "openvino"]:
+            raise ValidationError(f"Unsupported backend: {backend}")
+        if precision == "fp16" and backend != "torch":
+            raise ValidationError("fp16 precision requires the torch backend")
+        if num_threads is not None and (not isinstance(num_threads, int) or num_threads < 1):
+            raise ValidationError(f"num_threads must be a positive integer, got {num_threads}")
+        # Halving the model or handing it to a worker pool would change it for every sharer
+        if share_model and (precision != "fp32" or use_multi_gpu):
+            raise ValidationError("share_model requires fp32 precision without multi-GPU encoding")
+
         self._model: SentenceTransformer | None = None
+        # Half-precision and exported-backend embeddings differ slightly, so they are cached apart
+        cache_name = model_name if precision == "fp32" else f"{model_name}.{precision}"
+        if backend != "torch":
+            cache_name = f"{cache_name}.{backend}"
+        self._embedding_cache = EmbeddingCache(cache_name, cache_dir) if cache_dir is not None else None
 
         logger.debug(f"Configured semantic similarity with model: {model_name}")
 
@@ -49,14 +201,41 @@ class SemanticSimilarityCalculator(BaseSimilarityCalculator, ClusteringMixin):
     def model(self) -> SentenceTransformer:
         """Lazy-load the SentenceTransformer model."""
         if self._model is None:
-            try:
-                logger.info(f"Loading SentenceTransformer model: {self.model_name}")
-                self._model = SentenceTransformer(self.model_name)
-            except (OSError, ValueError, RuntimeError) as e:
-                logger.error(f"Failed to load model {self.model_name}: {e}")
-                raise RuntimeError(f"Failed to load model {self.model_name}") from e
+            if self.num_threads is not None:
+                torch.set_num_threads(self.num_threads)
+            loader = _shared_model if self.share_model else _load_model
+            model = loader(self.model_name, self.device, self.backend)
+            logger.debug(f"Model {self.model_name} loaded on device {model.device}")
+            if self.precision == "fp16":
+                if model.device.type == "cuda":
+                    model.half()
+                else:
+                    logger.warning(f"fp16 precision needs a CUDA device, keeping fp32 on {model.device}")
+            self._model = model
         return self._model
 
+    def _encode(self, texts: list[str]) -> Any:
+        """Embed texts with the model, reusing cached embeddings when configured."""
+        if self.use_multi_gpu and not self._pool_checked:
+            self._pool_checked = True
+            self._pool = _start_encode_pool(self.model)
+        return _encode_texts(self.model, texts, self._embedding_cache, self._pool)
+
+    def close(self) -> None:
+        """Stop multi-GPU encoding workers, if any were started."""
+        if self._pool is not None:
+            SentenceTransformer.stop_multi_process_pool(self._pool)
+            self._pool = None
+        self._pool_checked = False
+
+    def __enter__(self) -> "SemanticSimilarityCalculator":
+        """Return the calculator for use in a with block."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop multi-GPU encoding workers on leaving a with block."""
+        self.close()
+
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate semantic similarity between two texts using embeddings.
 
@@ -69,7 +248,7 @@ class SemanticSimilarityCalculator(BaseSimilarityCalculator, ClusteringMixin):
         """
         try:
             # Generate embeddings
-            embeddings = self.model.encode([text1, text2], convert_to_tensor=True, show_progress_bar=False)
+            embeddings = self._encode([text1, text2])
 
             # Calculate cosine similarity
             cosine_scores = util.pytorch_cos_sim(embeddings[0:1], embeddings[1:2])
@@ -107,13 +286,10 @@ class SemanticSimilarityCalculator(BaseSimilarityCalculator, ClusteringMixin):
 
         try:
             # Generate embeddings for all texts
-            embeddings = self.model.encode(texts, convert_to_tensor=True, show_progress_bar=False)
-
-            # Calculate full similarity matrix
-            cosine_scores = util.pytorch_cos_sim(embeddings, embeddings)
+            embeddings = self._encode(texts)
 
-            # Convert to numpy and apply threshold
-            matrix = cosine_scores.cpu().numpy()
+            # Calculate full similarity matrix and apply threshold
+            matrix = _cosine_similarity_matrix(embeddings)
             matrix[matrix < threshold] = 0.0
 
             # Create DataFrame with text indices as labels
@@ -169,49 +345,56 @@ class SemanticSimilarityCalculator(BaseSimilarityCalculator, ClusteringMixin):
             return []
 
         try:
-            # Generate embeddings
+            # Generate embeddings once per distinct text; queries and candidates often overlap
             logger.debug("Generating embeddings for similarity search...")
-            query_embeddings = self.model.encode(list(query_files.values()), convert_to_tensor=True, show_progress_bar=False)
-            candidate_embeddings = self.model.encode(
-                list(candidate_files.values()), convert_to_tensor=True, show_progress_bar=False
-            )
+            text_rows: dict[str, int] = {}
+            for text in (*query_files.values(), *candidate_files.values()):
+                text_rows.setdefault(text, len(text_rows))
+            embeddings = self._encode(list(text_rows))
+            query_embeddings = embeddings[[text_rows[text] for text in query_files.values()]]
+            candidate_embeddings = embeddings[[text_rows[text] for text in candidate_files.values()]]
 
-            # Calculate similarities
-            cosine_scores = util.pytorch_cos_sim(query_embeddings, candidate_embeddings)
+            # Calculate similarities, copied to host memory once for vectorized filtering
+            cosine_scores = util.pytorch_cos_sim(query_embeddings, candidate_embeddings).cpu().numpy()
 
         except (RuntimeError, ValueError, AttributeError) as e:
             logger.error(f"Failed to generate embeddings or calculate similarities: {e}")
             raise RuntimeError("Failed to process documents for similarity") from e
 
-        results = []
         query_paths = list(query_files.keys())
         candidate_paths = list(candidate_files.keys())
 
-        # Extract results above threshold
-        for i, query_path in enumerate(query_paths):
-            for j, candidate_path in enumerate(candidate_paths):
-                # Skip self-comparison
-                if query_path == candidate_path:
-                    continue
-
-                score = float(cosine_scores[i][j])
-
-                if score >= threshold:
-                    result = SimilarityResult(
-                        source=query_path,
-                        target=candidate_path,
-                        score=score,
-                        technique="semantic_embedding",
-                        metadata={
-                            "model": self.model_name,
-                            "query_length": len(query_files[query_path]),
-                            "candidate_length": len(candidate_files[candidate_path]),
-                        },
-                    )
-                    results.append(result)
-
-        # Sort by similarity score (descending)
-        results.sort(key=lambda x: x.score, reverse=True)
+        query_lengths = [len(text) for text in query_files.values()]
+        candidate_lengths = [len(text) for text in candidate_files.values()]
+
+        # Extract results above threshold, skipping self-comparison; paths are unique per
+        # mapping, so each query matches at most one candidate, found by hash lookup
+        above = cosine_scores >= threshold
+        candidate_cols = {path: j for j, path in enumerate(candidate_paths)}
+        for i, path in enumerate(query_paths):
+            j = candidate_cols.get(path)
+            if j is not None:
+                above[i, j] = False
+        rows, cols = np.nonzero(above)
+
+        # Scores at or above threshold are non-negative; clamp float error above 1.0 and
+        # order by score (descending) before building results, stable like list.sort
+        scores = np.minimum(cosine_scores[rows, cols], 1.0)
+        order = np.argsort(-scores, kind="stable")
+        results = [
+            SimilarityResult.create_unchecked(
+                source=query_paths[i],
+                target=candidate_paths[j],
+                score=score,
+                technique="semantic_embedding",
+                metadata={
+                    "model": self.model_name,
+                    "query_length": query_lengths[i],
+                    "candidate_length": candidate_lengths[j],
+                },
+            )
+            for i, j, score in zip(rows[order].tolist(), cols[order].tolist(), scores[order].tolist(), strict=True)
+        ]
 
         logger.info(f"Found {len(results)} semantically similar document pairs above threshold {threshold}")
         return results
@@ -223,6 +406,8 @@ def analyze_semantic_similarity(
     root_dir: Path,
     threshold: float | None = None,
     model: SentenceTransformer | None = None,
+    device: str | None = None,
+    cache_dir: str | Path | None = None,
 ) -> pd.DataFrame:
     """Analyze semantic similarity between not_in_use and active documents.
 
@@ -235,6 +420,9 @@ def analyze_semantic_similarity(
         root_dir: Root directory for relative path calculation
         threshold: Minimum similarity score to consider
         model: Pre-loaded SentenceTransformer model (optional)
+        device: Torch device for loading the model when none is given (None picks a GPU if available)
+        cache_dir: Directory for persistent embeddings; only used when model is not given,
+            since cached embeddings are keyed by model name
 
     Returns:
         DataFrame with columns: not_in_use, matched_file, similarity
@@ -246,8 +434,10 @@ def analyze_semantic_similarity(
     if threshold is None:
         threshold = SIMILARITY_THRESHOLD_LOW
 
-    # Use calculator for consistent behavior
-    calculator = SemanticSimilarityCalculator()
+    # Use calculator for consistent behavior; a caller's own model bypasses the name-keyed cache
+    calculator = SemanticSimilarityCalculator(
+        device=device, cache_dir=cache_dir if model is None else None, share_model=True
+    )
     if model is not None:
         calculator._model = model
 
@@ -267,6 +457,7 @@ def create_similarity_matrix(
     documents: list[Path],
     root_dir: Path,
     model: SentenceTransformer | None = None,
+    cache_dir: str | Path | None = None,
 ) -> tuple[pd.DataFrame, list[str]]:
     """Create a full similarity matrix for a set of documents.
 
@@ -277,6 +468,8 @@ def create_similarity_matrix(
         documents: List of document paths
         root_dir: Root directory for relative path calculation
         model: Pre-loaded SentenceTransformer model (optional)
+        cache_dir: Directory for persistent embeddings; only used when model is not given,
+            since cached embeddings are keyed by model name
 
     Returns:
         Tuple of (similarity_matrix_df, document_names)
@@ -309,8 +502,8 @@ def create_similarity_matrix(
         logger.warning("Need at least 2 documents for similarity matrix")
         return pd.DataFrame(), []
 
-    # Use calculator
-    calculator = SemanticSimilarityCalculator()
+    # Use calculator; a caller's own model bypasses the name-keyed cache
+    calculator = SemanticSimilarityCalculator(cache_dir=cache_dir if model is None else None, share_model=True)
     if model is not None:
         calculator._model = model
 
@@ -378,6 +571,9 @@ def analyze_active_document_similarities(
     threshold: float | None = None,
     exclude_self: bool = True,
     model: SentenceTransformer | None = None,
+    device: str | None = None,
+    cache_dir: str | Path | None = None,
+    use_multi_gpu: bool = False,
 ) -> pd.DataFrame:
     """Analyze semantic similarity among active documents to find potential duplicates.
 
@@ -389,6 +585,10 @@ def analyze_active_document_similarities(
         threshold: Minimum similarity score to consider (defaults to SIMILARITY_THRESHOLD_LOW)
         exclude_self: Whether to exclude self-comparisons (default: True)
         model: Pre-loaded SentenceTransformer model (optional)
+        device: Torch device for loading the model when none is given (None picks a GPU if available)
+        cache_dir: Directory for persistent embeddings; only used when model is not given,
+            since cached embeddings are keyed by model name
+        use_multi_gpu: Encode with one worker process per GPU when at least two are available
 
     Returns:
         DataFrame with columns: doc1, doc2, similarity, relationship_type
@@ -430,71 +630,85 @@ def analyze_active_document_similarities(
         logger.error(f"Document validation failed: {e}")
         raise
 
-    # Load file contents
+    cache = None
+    if model is None:
+        # A worker pool moves its model to the CPU, so it gets a private copy rather than the shared one.
+        # The backend is passed explicitly so the cache key matches SemanticSimilarityCalculator.model's
+        model = (_load_model if use_multi_gpu else _shared_model)(DEFAULT_MODEL_NAME, device, "torch")
+        if cache_dir is not None:
+            cache = EmbeddingCache(DEFAULT_MODEL_NAME, cache_dir)
+
+    # Load and embed documents DOCUMENT_CHUNK_SIZE at a time, so only one chunk of
+    # file contents is held in memory alongside the much smaller embeddings
+    logger.info(f"Generating embeddings for {len(active_docs)} documents...")
+    file_names: list[str] = []
+    loaded: set[str] = set()
+    embedding_chunks = []
+    pool = _start_encode_pool(model) if use_multi_gpu else None
     try:
-        active_files = load_markdown_files(active_docs, root_dir)
-    except (OSError, ValueError) as e:
-        logger.error(f"Failed to load files: {e}")
-        raise RuntimeError("Failed to load document files") from e
+        for start in range(0, len(active_docs), DOCUMENT_CHUNK_SIZE):
+            try:
+                chunk_files = load_markdown_files(active_docs[start : start + DOCUMENT_CHUNK_SIZE], root_dir)
+            except (OSError, ValueError) as e:
+                logger.error(f"Failed to load files: {e}")
+                raise RuntimeError("Failed to load document files") from e
+
+            # A document listed in more than one chunk is embedded once, as a single load would
+            chunk_files = {name: text for name, text in chunk_files.items() if name not in loaded}
+            if not chunk_files:
+                continue
 
-    if len(active_files) < 2:
+            try:
+                embedding_chunks.append(_encode_texts(model, list(chunk_files.values()), cache, pool))
+            except (RuntimeError, ValueError) as e:
+                logger.error(f"Failed to generate embeddings: {e}")
+                raise RuntimeError("Failed to generate document embeddings") from e
+            file_names.extend(chunk_files)
+            loaded.update(chunk_files)
+    finally:
+        if pool is not None:
+            SentenceTransformer.stop_multi_process_pool(pool)
+
+    if len(file_names) < 2:
         logger.warning("Insufficient files to analyze after loading")
         return pd.DataFrame(columns=["doc1", "doc2", "similarity", "relationship_type"])
 
-    # Create embeddings
-    if model is None:
-        logger.info(f"Loading SentenceTransformer model: {DEFAULT_MODEL_NAME}")
-        try:
-            model = SentenceTransformer(DEFAULT_MODEL_NAME)
-        except (OSError, ValueError, RuntimeError) as e:
-            logger.error(f"Failed to load model: {e}")
-            raise RuntimeError(f"Failed to load model {DEFAULT_MODEL_NAME}") from e
-
-    file_names = list(active_files.keys())
-    logger.info(f"Generating embeddings for {len(file_names)} documents...")
-
-    try:
-        embeddings = model.encode(list(active_files.values()), convert_to_tensor=True, show_progress_bar=False)
-    except (RuntimeError, ValueError) as e:
-        logger.error(f"Failed to generate embeddings: {e}")
-        raise RuntimeError("Failed to generate document embeddings") from e
+    embeddings = embedding_chunks[0] if len(embedding_chunks) == 1 else torch.cat(embedding_chunks)
 
     # Calculate pairwise similarities efficiently
     logger.info("Computing similarity matrix...")
     try:
-        cosine_scores = util.pytorch_cos_sim(embeddings, embeddings)
+        cosine_scores = _cosine_similarity_matrix(embeddings)
     except (RuntimeError, ValueError, AttributeError) as e:
         logger.error(f"Failed to compute similarities: {e}")
         raise RuntimeError("Failed to compute similarity matrix") from e
 
-    results: list[dict[str, Any]] = []
     n_docs = len(file_names)
 
     logger.info(f"Comparing {n_docs * (n_docs - 1) // 2} document pairs...")
 
-    for i in range(n_docs):
-        for j in range(i + 1 if exclude_self else i, n_docs):
-            if exclude_self and i == j:
-                continue
-
-            score = float(cosine_scores[i][j])
-            if score >= threshold:
-                doc1, doc2 = file_names[i], file_names[j]
-
-                # Classify relationship type based on similarity score
-                if score >= SIMILARITY_THRESHOLD_HIGH:
-                    relationship_type = "NEAR_DUPLICATE"
-                elif score >= SIMILARITY_THRESHOLD_MEDIUM:
-                    relationship_type = "HIGH_OVERLAP"
-                elif score >= SIMILARITY_THRESHOLD_LOW:
-                    relationship_type = "MODERATE_OVERLAP"
-                else:
-                    relationship_type = "LOW_SIMILARITY"
-
-                results.append({"doc1": doc1, "doc2": doc2, "similarity": score, "relationship_type": relationship_type})
-
-    # Sort by similarity score (highest first)
-    results.sort(key=lambda x: x["similarity"], reverse=True)
+    # Upper-triangle pairs at or above threshold, in row-major order
+    rows, cols = np.nonzero(np.triu(cosine_scores >= threshold, k=1 if exclude_self else 0))
+    scores = cosine_scores[rows, cols].astype(np.float64)
+
+    # Classify relationship type based on similarity score
+    relationship_types = np.select(
+        [scores >= SIMILARITY_THRESHOLD_HIGH, scores >= SIMILARITY_THRESHOLD_MEDIUM, scores >= SIMILARITY_THRESHOLD_LOW],
+        ["NEAR_DUPLICATE", "HIGH_OVERLAP", "MODERATE_OVERLAP"],
+        default="LOW_SIMILARITY",
+    )
+
+    # Sort by similarity score (highest first); stable so ties keep pair order
+    order = np.argsort(-scores, kind="stable")
+    names = np.array(file_names, dtype=object)
+    results = pd.DataFrame(
+        {
+            "doc1": names[rows[order]],
+            "doc2": names[cols[order]],
+            "similarity": scores[order],
+            "relationship_type": relationship_types[order].astype(object),
+        }
+    )
 
     logger.info(f"Found {len(results)} similar document pairs")
-    return pd.DataFrame(results)
+    return results
@@ -6,15 +6,17 @@ for fast string-based similarity analysis.
 
 import logging
 import re
-from difflib import SequenceMatcher
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
-import pandas as pd
-from rapidfuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
+from scipy.sparse import csr_matrix, issparse
 
 from ..analyzers import load_markdown_files
 from ..config import (
+    DEFAULT_BATCH_SIZE,
     DUPLICATE_THRESHOLD,
     MIN_CONTENT_LENGTH,
     SIMILARITY_THRESHOLD_HIGH,
@@ -22,10 +24,13 @@ from ..config import (
 )
 from ..validation import ValidationError, validate_file_path, validate_string_input, validate_threshold
 
-from .base import BaseSimilarityCalculator, ClusteringMixin, SimilarityResult
+from .base import BaseSimilarityCalculator, ClusteringMixin, SimilarityResult, clusters_from_adjacency
 
 logger = logging.getLogger(__name__)
 
+# Whitespace-only lines between newlines, collapsed so paragraphs split on a literal "\n\n"
+_BLANK_LINE_RE = re.compile(r"\n[^\S\n]+\n")
+
 
 class StringSimilarityCalculator(BaseSimilarityCalculator, ClusteringMixin):
     """String-based similarity calculator using fuzzy matching.
@@ -69,6 +74,78 @@ class StringSimilarityCalculator(BaseSimilarityCalculator, ClusteringMixin):
             logger.warning(f"Fuzzy matching failed: {e}")
             return 0.0
 
+    def _calculate_batch(self, texts: list[str]) -> np.ndarray | None:
+        """Score all text pairs with one rapidfuzz cdist call.
+
+        Args:
+            texts: Texts to compare
+
+        Returns:
+            Square array of similarity scores between 0.0 and 1.0
+        """
+        scores = process.cdist(texts, texts, scorer=self._fuzz_func, dtype=np.float32, workers=-1)
+        return scores / 100.0
+
+    def calculate_sparse_matrix(self, texts: list[str], threshold: float = 0.0) -> csr_matrix:
+        """Calculate a sparse pairwise similarity matrix for a list of texts.
+
+        Only the upper triangle is scored, in blocks of rows with
+        ``rapidfuzz.process.cdist`` so the pair loop runs natively on all cores.
+        The result is a symmetric matrix that stores the diagonal and the
+        scores at or above threshold, so memory grows with the number of
+        similar pairs rather than n².
+
+        Args:
+            texts: List of texts to compare
+            threshold: Minimum similarity score to store
+
+        Returns:
+            Sparse square CSR matrix of similarity scores
+
+        Raises:
+            ValidationError: If input validation fails
+            ValueError: If texts list is empty
+        """
+        if not texts:
+            raise ValueError("Text list cannot be empty")
+
+        threshold = validate_threshold(threshold)
+        for i, text in enumerate(texts):
+            self._validate_text_input(text, f"texts[{i}]")
+
+        n = len(texts)
+        diagonal = np.arange(n)
+        upper_rows: list[np.ndarray] = [diagonal]
+        upper_cols: list[np.ndarray] = [diagonal]
+        upper_data: list[np.ndarray] = [np.ones(n)]  # Self-similarity is always 1.0
+
+        # Score blocks of rows against the remaining columns in native code; only
+        # the upper triangle of each block is kept
+        for start in range(0, n, DEFAULT_BATCH_SIZE):
+            stop = min(start + DEFAULT_BATCH_SIZE, n)
+            block = (
+                process.cdist(
+                    texts[start:stop],
+                    texts[start:],
+                    scorer=self._fuzz_func,
+                    processor=None,
+                    dtype=np.float64,
+                    workers=-1,
+                )
+                / 100.0
+            )
+            block_rows, block_cols = np.nonzero(np.triu((block >= threshold) & (block > 0.0), k=1))
+            upper_rows.append(block_rows + start)
+            upper_cols.append(block_cols + start)
+            upper_data.append(block[block_rows, block_cols])
+
+        # Mirror the off-diagonal scores so the matrix stays symmetric
+        rows = np.concatenate(upper_rows + upper_cols[1:])
+        cols = np.concatenate(upper_cols + upper_rows[1:])
+        data = np.concatenate(upper_data + upper_data[1:])
+
+        return csr_matrix((data, (rows, cols)), shape=(n, n))
+
     def find_similar_documents(
         self, query_docs: list[Path], candidate_docs: list[Path], root_dir: Path, threshold: float = 0.5
     ) -> list[SimilarityResult]:
@@ -122,7 +199,8 @@ class StringSimilarityCalculator(BaseSimilarityCalculator, ClusteringMixin):
                     score = self._calculate_similarity(query_content, candidate_content)
 
                     if score >= threshold:
-                        result = SimilarityResult(
+                        # rapidfuzz scores are 0-100, so the normalized score is already in range
+                        result = SimilarityResult.create_unchecked(
                             source=query_path,
                             target=candidate_path,
                             score=score,
@@ -146,18 +224,18 @@ class StringSimilarityCalculator(BaseSimilarityCalculator, ClusteringMixin):
         return results
 
 
-def get_similarity_matrix(texts: list[str], threshold: float | None = None) -> list[list[float]]:
+def get_similarity_matrix(texts: list[str], threshold: float | None = None) -> csr_matrix:
     """Calculate pairwise similarity matrix for a list of texts.
 
     Legacy function for backward compatibility. Consider using
-    StringSimilarityCalculator.calculate_matrix() instead.
+    StringSimilarityCalculator.calculate_sparse_matrix() instead.
 
     Args:
         texts: List of text documents
         threshold: Minimum similarity to include in results
 
     Returns:
-        Square matrix of similarity scores
+        Sparse square CSR matrix of similarity scores
 
     Raises:
         ValidationError: If input validation fails
@@ -166,28 +244,22 @@ def get_similarity_matrix(texts: list[str], threshold: float | None = None) -> l
     if threshold is None:
         threshold = SIMILARITY_THRESHOLD_LOW
 
-    calculator = StringSimilarityCalculator()
-    matrix = calculator.calculate_matrix(texts, threshold)
+    return StringSimilarityCalculator().calculate_sparse_matrix(texts, threshold)
 
-    # Convert to list format if needed
-    if isinstance(matrix, list):
-        return matrix
-    if isinstance(matrix, pd.DataFrame):
-        df_result: list[list[float]] = matrix.values.tolist()
-        return df_result
-    # numpy array
-    np_result: list[list[float]] = matrix.tolist()
-    return np_result
 
-
-def find_duplicate_groups(similarity_matrix: list[list[float]], threshold: float | None = None) -> list[list[int]]:
+def find_duplicate_groups(
+    similarity_matrix: list[list[float]] | csr_matrix, threshold: float | None = None
+) -> list[list[int]]:
     """Find groups of highly similar documents from similarity matrix.
 
     Legacy function for backward compatibility. Consider using
     StringSimilarityCalculator with ClusteringMixin instead.
 
+    Sparse matrices are clustered by walking only their stored entries;
+    entries that are not stored count as 0.0.
+
     Args:
-        similarity_matrix: Square similarity matrix
+        similarity_matrix: Square similarity matrix (nested list or sparse)
         threshold: Minimum similarity to consider as duplicates
 
     Returns:
@@ -207,17 +279,54 @@ def find_duplicate_groups(similarity_matrix: list[list[float]], threshold: float
         logger.error(f"Invalid threshold: {e}")
         raise
 
+    if issparse(similarity_matrix):
+        return _find_sparse_duplicate_groups(similarity_matrix, threshold)
+
     # Validate matrix
     if not similarity_matrix:
         raise ValueError("Similarity matrix cannot be empty")
 
-    n = len(similarity_matrix)
-    if not all(len(row) == n for row in similarity_matrix):
+    # NumPy rejects ragged rows while building the array, so one conversion also checks the shape
+    try:
+        scores = np.asarray(similarity_matrix)
+    except ValueError as e:
+        raise ValueError("Similarity matrix must be square") from e
+    if scores.ndim != 2 or scores.shape[0] != scores.shape[1]:
         raise ValueError("Similarity matrix must be square")
 
     # Use clustering mixin functionality
     calculator = StringSimilarityCalculator()
-    return calculator.find_clusters(similarity_matrix, threshold)
+    return calculator.find_clusters(scores, threshold)
+
+
+def _find_sparse_duplicate_groups(similarity_matrix: csr_matrix, threshold: float) -> list[list[int]]:
+    """Cluster a sparse similarity matrix, matching ClusteringMixin.find_clusters.
+
+    Args:
+        similarity_matrix: Sparse square similarity matrix
+        threshold: Minimum similarity to consider as duplicates
+
+    Returns:
+        List of document index groups that are similar
+
+    Raises:
+        ValueError: If matrix is invalid
+    """
+    n, m = similarity_matrix.shape
+    if n == 0:
+        raise ValueError("Similarity matrix cannot be empty")
+    if n != m:
+        raise ValueError("Similarity matrix must be square")
+
+    # Keep only stored entries at or above threshold as graph edges
+    adjacency = similarity_matrix.tocsr(copy=True)
+    adjacency.data = adjacency.data >= threshold
+    adjacency.eliminate_zeros()
+
+    clusters = clusters_from_adjacency(adjacency)
+
+    logger.debug(f"Found {len(clusters)} clusters with threshold {threshold}")
+    return clusters
 
 
 def find_best_match(section: str, targets: list[str], threshold: float | None = None) -> tuple[str | None, float]:
@@ -270,26 +379,25 @@ def find_best_match(section: str, targets: list[str], threshold: float | None =
     return best_match, best_score
 
 
-def split_sections(text: str, min_len: int | None = None) -> list[str]:
-    r"""Split markdown text into sections by paragraph.
+def iter_sections(text: str, min_len: int | None = None) -> Iterator[str]:
+    r"""Lazily split markdown text into sections by paragraph.
 
-    Splits text on double newlines and filters out sections shorter than
-    the minimum length requirement.
+    Input is validated eagerly; sections are then produced one at a time so
+    callers that consume them once never hold the full section list.
 
     Args:
         text: Text to split into sections
         min_len: Minimum section length to include (defaults to MIN_CONTENT_LENGTH)
 
     Returns:
-        List of text sections meeting minimum length requirement
+        Iterator over text sections meeting minimum length requirement
 
     Raises:
         ValidationError: If text validation fails
 
     Example:
-        >>> sections = split_sections("Hello\n\nWorld\n\nShort", min_len=5)
-        >>> len(sections)
-        2
+        >>> next(iter_sections("Hello\n\nWorld", min_len=5))
+        'Hello'
     """
     # Validate input
     try:
@@ -308,15 +416,63 @@ def split_sections(text: str, min_len: int | None = None) -> list[str]:
     elif min_len < 0:
         raise ValidationError(f"Minimum length must be non-negative: {min_len}")
 
-    # Split by double newlines
-    sections = re.split(r"\n\s*\n", validated_text)
+    # Collapse whitespace-only lines so blank lines are a literal "\n\n"; section text is left as-is
+    normalized = _BLANK_LINE_RE.sub("\n\n", validated_text)
+    return _generate_sections(normalized, min_len)
+
+
+def _generate_sections(normalized: str, min_len: int) -> Iterator[str]:
+    """Yield stripped sections of normalized text separated by blank lines.
+
+    Gives the sections the previous regex split on blank lines did: a run
+    of blank lines is one separator, so an empty section (kept only when
+    min_len is 0) appears only before the first or after the last one.
+
+    Args:
+        normalized: Text whose blank lines are exactly two newline characters
+        min_len: Minimum section length to include
 
-    # Filter and clean sections
-    valid_sections: list[str] = []
-    for section in sections:
+    Yields:
+        Sections meeting minimum length requirement
+    """
+    start = 0
+    while True:
+        end = normalized.find("\n\n", start)
+        section = normalized[start:] if end == -1 else normalized[start:end]
+
+        # Runs of blank lines leave empty pieces between their separators
         cleaned = section.strip()
-        if len(cleaned) >= min_len:
-            valid_sections.append(cleaned)
+        if len(cleaned) >= min_len and (cleaned or start == 0 or end == -1):
+            yield cleaned
+
+        if end == -1:
+            return
+        start = end + 2
+
+
+def split_sections(text: str, min_len: int | None = None) -> list[str]:
+    r"""Split markdown text into sections by paragraph.
+
+    Splits text on double newlines and filters out sections shorter than
+    the minimum length requirement. Use ``iter_sections`` when the sections
+    are consumed only once.
+
+    Args:
+        text: Text to split into sections
+        min_len: Minimum section length to include (defaults to MIN_CONTENT_LENGTH)
+
+    Returns:
+        List of text sections meeting minimum length requirement
+
+    Raises:
+        ValidationError: If text validation fails
+
+    Example:
+        >>> sections = split_sections("Hello\n\nWorld\n\nShort", min_len=5)
+        >>> len(sections)
+        2
+    """
+    valid_sections = list(iter_sections(text, min_len))
 
     logger.debug(f"Split text into {len(valid_sections)} sections")
     return valid_sections
@@ -377,10 +533,13 @@ def is_similar(a: str, b: str, threshold: int | None = None) -> bool:
 
 
 def get_best_match_seq(section: str, targets: list[str]) -> tuple[str, float]:
-    """Get best match using SequenceMatcher for debugging fallback matching.
+    """Get best match by character-level ratio for debugging fallback matching.
 
     This provides character-level similarity comparison as a fallback
     to catch similarities that token-based fuzzy matching might miss.
+    Uses rapidfuzz's ``fuzz.ratio`` (normalized Indel similarity, the same
+    measure as ``difflib.SequenceMatcher.ratio`` without its junk heuristics)
+    through a single ``process.extractOne`` call.
 
     Args:
         section: Source section to match
@@ -408,26 +567,24 @@ def get_best_match_seq(section: str, targets: list[str]) -> tuple[str, float]:
     if not targets:
         raise ValueError("Targets list cannot be empty")
 
-    best_match: str = ""
-    best_score: float = 0.0
-
+    # Validate each target
+    validated_targets: list[str] = []
     for i, target in enumerate(targets):
         try:
-            # Validate each target
-            validated_target = validate_string_input(target, f"target[{i}]", max_length=100_000)
-
-            # Calculate similarity ratio
-            matcher = SequenceMatcher(None, validated_section, validated_target)
-            score = matcher.ratio()
-
-            if score > best_score:
-                best_score = score
-                best_match = validated_target
-
+            validated_targets.append(validate_string_input(target, f"target[{i}]", max_length=100_000))
         except ValidationError as e:
             logger.warning(f"Skipping invalid target at index {i}: {e}")
             continue
 
+    best_match: str = ""
+    best_score: float = 0.0
+
+    # rapidfuzz returns score 0-100, normalize to 0-1
+    result = process.extractOne(validated_section, validated_targets, scorer=fuzz.ratio, processor=None)
+    if result is not None and result[1] > 0:
+        best_match = result[0]
+        best_score = result[1] / 100.0
+
     logger.debug(f"Best match found with score {best_score:.3f} for section of length {len(section)}")
 
     return best_match, best_score
@@ -8,6 +8,7 @@ according to CLAUDE.md requirements.
 import logging
 import os
 import re
+import stat
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
@@ -27,7 +28,11 @@ class ValidationError(Exception):
 
 
 def validate_file_path(
-    path: str | Path, must_exist: bool = True, allowed_extensions: list[str] | None = None, check_readable: bool = True
+    path: str | Path,
+    must_exist: bool = True,
+    allowed_extensions: list[str] | None = None,
+    check_readable: bool = True,
+    stat_result: os.stat_result | None = None,
 ) -> Path:
     """Validate and sanitize file path to prevent security issues.
 
@@ -36,6 +41,8 @@ def validate_file_path(
         must_exist: Whether the file must exist
         allowed_extensions: List of allowed file extensions (e.g., ['.md', '.py'])
         check_readable: Whether to check if the file is readable
+        stat_result: Stat result already obtained for path (e.g. from ``os.DirEntry.stat()``);
+            when given, existence, type and size checks use it instead of stat calls
 
     Returns:
         Validated Path object
@@ -73,17 +80,26 @@ def validate_file_path(
         if not allowed:
             raise ValidationError(ERROR_MESSAGES["path_not_allowed"].format(path=path_obj))
 
+    # Stat once and derive existence, type and size from the result
+    if stat_result is None:
+        try:
+            stat_result = path_obj.stat()
+        except OSError:
+            stat_result = None
+    exists = stat_result is not None
+    is_dir = stat_result is not None and stat.S_ISDIR(stat_result.st_mode)
+
     # Check file existence if required
-    if must_exist and not path_obj.exists():
+    if must_exist and not exists:
         raise ValidationError(ERROR_MESSAGES["file_not_found"].format(path=path_obj))
 
     # Check if it's a file (not a directory) - but only if we're validating a file path
     # Skip this check if called from validate_directory_path
-    if check_readable and path_obj.exists() and path_obj.is_dir():
+    if check_readable and is_dir:
         raise ValidationError(f"Path is not a file: {path_obj}")
 
     # Check if file is readable
-    if check_readable and path_obj.exists() and not os.access(path_obj, os.R_OK):
+    if check_readable and exists and not os.access(path_obj, os.R_OK):
         raise ValidationError(f"File is not readable: {path_obj}")
 
     # Validate extension if specified
@@ -91,8 +107,8 @@ def validate_file_path(
         raise ValidationError(f"Invalid file extension: {path_obj.suffix}. Allowed: {', '.join(allowed_extensions)}")
 
     # Check file size if it exists
-    if path_obj.exists() and path_obj.is_file():
-        size_mb = path_obj.stat().st_size / (1024 * 1024)
+    if stat_result is not None and stat.S_ISREG(stat_result.st_mode):
+        size_mb = stat_result.st_size / (1024 * 1024)
         if size_mb > MAX_FILE_SIZE_MB:
             raise ValidationError(ERROR_MESSAGES["file_too_large"].format(max_size=MAX_FILE_SIZE_MB, path=path_obj))
 
@@ -174,7 +190,7 @@ def validate_string_input(
     field_name: str,
     max_length: int | None = 1000,
     allowed_values: list[str] | None = None,
-    pattern: str | None = None,
+    pattern: str | re.Pattern[str] | None = None,
     allow_empty: bool = False,
 ) -> str:
     """Validate and sanitize string input.
@@ -184,7 +200,7 @@ def validate_string_input(
         field_name: Field name for error messages
         max_length: Maximum allowed length
         allowed_values: List of allowed values
-        pattern: Regex pattern to match
+        pattern: Regex pattern to match, as a string or precompiled pattern
         allow_empty: Whether to allow empty strings
 
     Returns:
@@ -207,7 +223,10 @@ def validate_string_input(
     if allowed_values and str_value not in allowed_values:
         raise ValidationError(f"Invalid {field_name}: '{str_value}'. Allowed values: {', '.join(allowed_values)}")
 
-    if pattern and not re.match(pattern, str_value):
+    if isinstance(pattern, re.Pattern):
+        if not pattern.match(str_value):
+            raise ValidationError(f"Invalid {field_name} format: '{str_value}' does not match pattern: {pattern.pattern}")
+    elif pattern and not re.match(pattern, str_value):
         raise ValidationError(f"Invalid {field_name} format: '{str_value}' does not match pattern: {pattern}")
 
     return str_value
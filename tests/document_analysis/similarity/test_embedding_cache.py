@@ -0,0 +1,62 @@
+"""Tests for embedding cache module."""
+
+from pathlib import Path
+
+import numpy as np
+
+from src.document_analysis.similarity.embedding_cache import EmbeddingCache
+
+
+class CountingModel:
+    """Stand-in for SentenceTransformer that records what it encodes."""
+
+    device = "cpu"
+
+    def __init__(self) -> None:
+        """Start with nothing encoded."""
+        self.encoded: list[str] = []
+
+    def encode(
+        self, texts: list[str], convert_to_numpy: bool = True, show_progress_bar: bool = False, pool: object = None
+    ) -> np.ndarray:
+        """Record texts and return deterministic three-dimensional embeddings for them."""
+        self.encoded.extend(texts)
+        return np.array([[len(text), text.count("a"), 1.0] for text in texts], dtype=np.float32)
+
+
+class TestEmbeddingCache:
+    """Test EmbeddingCache class."""
+
+    def test_encode_only_misses(self, tmp_path: Path) -> None:
+        """Test that cached texts are not encoded again, across cache instances."""
+        model = CountingModel()
+
+        first = EmbeddingCache("org/model", tmp_path).encode(model, ["alpha", "beta", "alpha"])
+        second = EmbeddingCache("org/model", tmp_path).encode(model, ["beta", "gamma", "alpha"])
+
+        assert model.encoded == ["alpha", "beta", "gamma"]
+        assert first.shape == (3, 3)
+        assert np.array_equal(first[0].numpy(), first[2].numpy())
+        assert np.array_equal(second[0].numpy(), first[1].numpy())
+        assert np.array_equal(second[2].numpy(), first[0].numpy())
+
+    def test_cache_file_per_model(self, tmp_path: Path) -> None:
+        """Test that each model gets its own sanitized SQLite file."""
+        cache = EmbeddingCache("org/model", tmp_path)
+
+        cache.store({cache.digest("text"): np.ones(3)})
+
+        assert cache.path == tmp_path / "org_model.sqlite3"
+        assert cache.path.exists()
+        assert EmbeddingCache("other", tmp_path).lookup([cache.digest("text")]) == {}
+
+    def test_unreadable_cache_is_a_miss(self, tmp_path: Path) -> None:
+        """Test that a corrupt cache file falls back to encoding."""
+        cache = EmbeddingCache("model", tmp_path)
+        cache.path.write_bytes(b"not a database")
+        model = CountingModel()
+
+        embeddings = cache.encode(model, ["alpha"])
+
+        assert model.encoded == ["alpha"]
+        assert embeddings.shape == (1, 3)
@@ -1,13 +1,18 @@
 """Tests for string similarity module."""
 
+import re
 
 import pytest
+from scipy.sparse import csr_matrix, issparse
 
 from src.document_analysis.similarity.string_similarity import (
     StringSimilarityCalculator,
     find_best_match,
+    find_duplicate_groups,
     get_best_match_seq,
+    get_similarity_matrix,
     is_similar,
+    iter_sections,
     split_sections,
 )
 from src.document_analysis.validation import ValidationError
@@ -51,6 +56,76 @@ class TestStringSimilarityCalculator:
         assert score < 0.5  # Should be quite different
 
 
+class TestGetSimilarityMatrix:
+    """Test get_similarity_matrix function."""
+
+    def test_returns_sparse_symmetric_matrix(self) -> None:
+        """Test that only the diagonal and scores above threshold are stored."""
+        texts = ["hello world example", "hello world example!", "completely different text"]
+        matrix = get_similarity_matrix(texts, threshold=0.9)
+
+        assert issparse(matrix)
+        assert matrix.shape == (3, 3)
+        dense = matrix.toarray()
+        assert (dense.diagonal() == 1.0).all()
+        assert dense[0, 1] == dense[1, 0]
+        assert dense[0, 1] >= 0.9
+        assert dense[0, 2] == 0.0
+        assert matrix.nnz == 5
+
+    def test_matches_pairwise_scores_across_blocks(self) -> None:
+        """Test that blocked scoring agrees with pairwise scoring beyond one block."""
+        texts = [f"document {i % 7} about topic {i % 3} with shared words" for i in range(40)]
+        calc = StringSimilarityCalculator()
+
+        dense = get_similarity_matrix(texts, threshold=0.8).toarray()
+
+        for i in range(len(texts)):
+            for j in range(len(texts)):
+                expected = 1.0 if i == j else calc.calculate_pairwise(texts[i], texts[j])
+                assert dense[i, j] == pytest.approx(expected if expected >= 0.8 else 0.0)
+
+    def test_empty_texts_error(self) -> None:
+        """Test error with empty text list."""
+        with pytest.raises(ValueError, match="Text list cannot be empty"):
+            get_similarity_matrix([])
+
+    def test_invalid_threshold_error(self) -> None:
+        """Test that out-of-range and non-numeric thresholds raise ValidationError."""
+        with pytest.raises(ValidationError, match="Threshold must be between 0 and 1"):
+            get_similarity_matrix(["first text", "second text"], threshold=1.5)
+        with pytest.raises(ValidationError, match="must be a number"):
+            get_similarity_matrix(["first text", "second text"], threshold="high")  # type: ignore[arg-type]
+
+
+class TestFindDuplicateGroups:
+    """Test find_duplicate_groups function."""
+
+    def test_sparse_matches_dense(self) -> None:
+        """Test that sparse and nested-list inputs give the same groups."""
+        dense = [
+            [1.0, 0.97, 0.0, 0.96],
+            [0.97, 1.0, 0.0, 0.0],
+            [0.0, 0.0, 1.0, 0.0],
+            [0.96, 0.0, 0.0, 1.0],
+        ]
+        assert find_duplicate_groups(csr_matrix(dense), 0.95) == find_duplicate_groups(dense, 0.95) == [[0, 1, 3]]
+
+    def test_sparse_groups_are_transitive(self) -> None:
+        """Test that chained duplicates form a single group."""
+        dense = [
+            [1.0, 0.96, 0.0],
+            [0.96, 1.0, 0.97],
+            [0.0, 0.97, 1.0],
+        ]
+        assert find_duplicate_groups(csr_matrix(dense), 0.95) == [[0, 1, 2]]
+
+    def test_sparse_non_square_error(self) -> None:
+        """Test error with non-square sparse matrix."""
+        with pytest.raises(ValueError, match="must be square"):
+            find_duplicate_groups(csr_matrix((2, 3)))
+
+
 class TestSplitSections:
     """Test split_sections function."""
 
@@ -70,6 +145,25 @@ class TestSplitSections:
         assert len(sections) == 2
         assert "Short" not in sections
 
+    def test_split_whitespace_only_separators(self) -> None:
+        """Test that blank lines containing whitespace or CRLF still separate sections."""
+        text = "First\r\n\r\nSecond\n \t\n\n  \nThird\nstill third"
+        sections = split_sections(text, min_len=0)
+        assert sections == ["First", "Second", "Third\nstill third"]
+
+    def test_split_keeps_crlf_inside_sections(self) -> None:
+        """Test that CRLF line endings inside a section are left untouched."""
+        text = "First line\r\nsecond line\r\n\r\nNext"
+        assert split_sections(text, min_len=0) == ["First line\r\nsecond line", "Next"]
+
+    def test_split_matches_regex_split(self) -> None:
+        """Test that sections match a regex split on blank lines followed by strip and length filter."""
+        texts = ["Body\n\n\n\nMore", "a\r\n \r\n\r\nb\n\t\n\nc", "x\n \n \n \ny\r\nz", "one\n\u2028\ntwo", "solo"]
+        for text in texts:
+            for min_len in (0, 1, 3):
+                expected = [cleaned for part in re.split(r"\n\s*\n", text) if len(cleaned := part.strip()) >= min_len]
+                assert split_sections(text, min_len=min_len) == expected
+
     def test_split_empty_text(self) -> None:
         """Test splitting empty text."""
         with pytest.raises(ValidationError):
@@ -81,6 +175,22 @@ class TestSplitSections:
             split_sections(None)  # type: ignore
 
 
+class TestIterSections:
+    """Test iter_sections function."""
+
+    def test_iter_matches_split(self) -> None:
+        """Test that iterating yields the same sections as split_sections."""
+        text = "Long section one\n\n\n\nShort\n\nLong section two\n \nLong section three"
+        sections = iter_sections(text, min_len=10)
+        assert not isinstance(sections, list)
+        assert list(sections) == split_sections(text, min_len=10)
+
+    def test_iter_validates_eagerly(self) -> None:
+        """Test that invalid input raises before iteration starts."""
+        with pytest.raises(ValidationError):
+            iter_sections("")
+
+
 class TestIsSimilar:
     """Test is_similar function."""
 
@@ -141,3 +251,15 @@ class TestGetBestMatchSeq:
         """Test error with empty targets."""
         with pytest.raises(ValueError, match="Targets list cannot be empty"):
             get_best_match_seq("test", [])
+
+    def test_no_overlap_returns_empty_match(self) -> None:
+        """Test that targets sharing no characters yield no match."""
+        match, score = get_best_match_seq("abc", ["xyz", "qqq"])
+        assert match == ""
+        assert score == 0.0
+
+    def test_invalid_targets_skipped(self) -> None:
+        """Test that invalid targets are skipped and valid ones still match."""
+        match, score = get_best_match_seq("hello", [None, "  ", "hello"])  # type: ignore[list-item]
+        assert match == "hello"
+        assert score == 1.0
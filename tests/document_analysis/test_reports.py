@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""Tests for document_analysis.reports module.
+
+Covers content embedding verification: per-pair analysis and logging,
+reuse of results for duplicated content, verbatim section search with and
+without pyahocorasick, and section match scoring.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from rapidfuzz import fuzz
+
+from src.document_analysis import reports
+from src.document_analysis.reports import check_content_embedding
+
+# (not_in_use, matched_file, similarity) rows, one below the default similarity threshold
+ROWS = [
+    ("old.md", "new.md", 0.9),
+    ("notes.txt", "plan.txt", 0.8),
+    ("old.md", "plan.txt", 0.5),
+    ("copy.md", "new.md", 0.85),
+]
+SHARED_SECTION = "This paragraph explains how the archive is rotated every night."
+FUZZY_SECTION = "This paragraph explains how the archive is rotated every single night."
+# Verbatim search input: duplicates, a section inside another, and sections absent from the content
+SEARCH_CONTENT = f"# Guide\n\n{SHARED_SECTION}\n\nBackups now run from the scheduler service instead of cron."
+SEARCH_SECTIONS = [SHARED_SECTION, FUZZY_SECTION, "the archive is rotated", SHARED_SECTION, "Backups now run", "cron job"]
+SEARCH_FOUND = [True, False, True, True, True, False]
+
+
+@pytest.fixture
+def docs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create documents under tmp_path and run from there, where the report is written."""
+    monkeypatch.chdir(tmp_path)
+    files = {
+        "old.md": f"# Old\n\n{SHARED_SECTION}\n\nOnly the old guide still mentions the legacy backup cron job.\n",
+        "new.md": f"# New\n\n{SHARED_SECTION}\n\nBackups now run from the scheduler service instead of cron.\n",
+        "copy.md": f"# Old\n\n{SHARED_SECTION}\n\nOnly the old guide still mentions the legacy backup cron job.\n",
+        "notes.txt": f"{FUZZY_SECTION}\n\nUnrelated notes about the office coffee machine and its filters.\n",
+        "plan.txt": f"{SHARED_SECTION}\n\nThe rollout plan lists three phases for the storage migration.\n",
+    }
+    for name, content in files.items():
+        (tmp_path / name).write_text(content, encoding="utf-8")
+    return tmp_path
+
+
+def similarity_frame(rows: list[tuple[str, str, float]]) -> pd.DataFrame:
+    """Build a similarity DataFrame in the shape check_content_embedding reads."""
+    return pd.DataFrame(rows, columns=["not_in_use", "matched_file", "similarity"])
+
+
+def per_row_analysis(root_dir: Path, rows: list[tuple[str, str, float]], min_section_length: int = 20) -> pd.DataFrame:
+    """Analyze every row on its own, as the loop before deduplication did."""
+    results = []
+    for not_in_use, matched, similarity in rows:
+        if not (root_dir / not_in_use).exists() or not (root_dir / matched).exists():
+            continue
+        not_in_use_content = (root_dir / not_in_use).read_text(encoding="utf-8")
+        matched_content = (root_dir / matched).read_text(encoding="utf-8")
+        results.append(
+            reports._analyze_pair(
+                not_in_use_content,
+                matched_content,
+                not_in_use_path=not_in_use,
+                matched_path=matched,
+                similarity=similarity,
+                min_section_length=min_section_length,
+                use_markdown=True,
+                digests=(reports._content_digest(not_in_use_content), reports._content_digest(matched_content)),
+                block_cache={},
+            )
+        )
+    return pd.DataFrame(results)
+
+
+def per_pair_section_matches(
+    sections: list[str], matched_content: str, matched_sections: list[str]
+) -> tuple[int, list[tuple[str, float]], list[tuple[str, float]]]:
+    """Score sections one pair at a time, as _calculate_section_matches did before cdist."""
+    embedded, fuzzy, partial = 0, [], []
+    for section in sections:
+        if section in matched_content:
+            embedded += 1
+            continue
+        best = max(
+            (
+                max(fuzz.token_set_ratio(section, target), fuzz.token_sort_ratio(section, target))
+                for target in matched_sections
+            ),
+            default=0,
+        )
+        if best >= 95:
+            embedded += 1
+        elif best >= 80:
+            fuzzy.append((section[:50] + "...", best))
+        elif best >= 70:
+            partial.append((section[:50] + "...", best))
+    return embedded, fuzzy, partial
+
+
+class TestCheckContentEmbedding:
+    """Test check_content_embedding function."""
+
+    def test_matches_per_row_analysis(self, docs: Path) -> None:
+        """Test the report gives the same frame as analyzing each row separately."""
+        result = check_content_embedding(similarity_frame(ROWS), docs)
+
+        expected = per_row_analysis(docs, [row for row in ROWS if row[2] >= 0.75])
+        pd.testing.assert_frame_equal(result, expected)
+        assert (docs / "content_embedding_report.tsv").exists()
+
+    def test_logs_each_pair(self, docs: Path, caplog: pytest.LogCaptureFixture) -> None:
+        """Test every analyzed row is logged once, in row order, including reused analyses."""
+        with caplog.at_level("INFO", logger=reports.__name__):
+            check_content_embedding(similarity_frame(ROWS), docs)
+
+        headers = [record.getMessage() for record in caplog.records if record.getMessage().startswith("📄")]
+        assert headers == [
+            "📄 old.md → new.md [Markdown-aware]",
+            "📄 notes.txt → plan.txt",
+            "📄 copy.md → new.md [same content as an analyzed pair]",
+        ]
+
+    def test_duplicate_content_reuses_analysis(self, docs: Path) -> None:
+        """Test a row with already analyzed content reuses the result but keeps its own paths and similarity."""
+        rows = [("old.md", "new.md", 0.9), ("copy.md", "new.md", 0.85)]
+
+        with patch.object(reports, "_analyze_pair", wraps=reports._analyze_pair) as analyze:
+            result = check_content_embedding(similarity_frame(rows), docs)
+
+        analyze.assert_called_once()
+        assert result[["not_in_use", "matched", "similarity"]].to_numpy().tolist() == [
+            ["old.md", "new.md", 0.9],
+            ["copy.md", "new.md", 0.85],
+        ]
+        shared_columns = result.columns.difference(["not_in_use", "matched", "similarity"])
+        assert result.loc[0, shared_columns].equals(result.loc[1, shared_columns])
+
+    def test_parses_each_document_once(self, docs: Path) -> None:
+        """Test markdown blocks are extracted once per distinct content, keyed by its digest."""
+        rows = [("old.md", "new.md", 0.9), ("old.md", "copy.md", 0.8), ("new.md", "copy.md", 0.8)]
+
+        with patch.object(reports.MarkdownAnalyzer, "extract_blocks", autospec=True) as extract:
+            extract.return_value = []
+            check_content_embedding(similarity_frame(rows), docs)
+
+        # copy.md has the same content as old.md, so only two documents are parsed
+        assert extract.call_count == 2
+
+    def test_missing_file_skipped(self, docs: Path) -> None:
+        """Test rows naming a missing file are left out of the report."""
+        rows = [("gone.md", "new.md", 0.95), ("old.md", "new.md", 0.9), ("notes.txt", "gone.txt", 0.8)]
+
+        result = check_content_embedding(similarity_frame(rows), docs)
+
+        assert result["not_in_use"].tolist() == ["old.md"]
+        assert result["matched"].tolist() == ["new.md"]
+
+    def test_no_rows_above_threshold(self, docs: Path) -> None:
+        """Test an empty frame is returned and no report is written when nothing qualifies."""
+        result = check_content_embedding(similarity_frame([("old.md", "new.md", 0.1)]), docs)
+
+        assert result.empty
+        assert not (docs / "content_embedding_report.tsv").exists()
+
+
+class TestFindEmbeddedSections:
+    """Test _find_embedded_sections function."""
+
+    def test_automaton_matches_substring_search(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the automaton path flags the same sections as substring search."""
+        ahocorasick = pytest.importorskip("ahocorasick")
+        monkeypatch.setattr(reports, "_AHOCORASICK_SCAN_COST", 0)
+        monkeypatch.setattr(reports, "_AHOCORASICK_BUILD_COST", 0)
+
+        with patch.object(ahocorasick, "Automaton", wraps=ahocorasick.Automaton) as automaton:
+            assert reports._find_embedded_sections(SEARCH_SECTIONS, SEARCH_CONTENT) == SEARCH_FOUND
+
+        automaton.assert_called_once()
+
+    def test_without_ahocorasick(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test substring search is used when pyahocorasick is not installed."""
+        monkeypatch.setitem(sys.modules, "ahocorasick", None)
+        monkeypatch.setattr(reports, "_AHOCORASICK_SCAN_COST", 0)
+        monkeypatch.setattr(reports, "_AHOCORASICK_BUILD_COST", 0)
+
+        assert reports._find_embedded_sections(SEARCH_SECTIONS, SEARCH_CONTENT) == SEARCH_FOUND
+
+    def test_small_search_skips_automaton(self) -> None:
+        """Test a few sections over short content do not pay for building an automaton."""
+        ahocorasick = pytest.importorskip("ahocorasick")
+
+        with patch.object(ahocorasick, "Automaton", wraps=ahocorasick.Automaton) as automaton:
+            assert reports._find_embedded_sections(SEARCH_SECTIONS, SEARCH_CONTENT) == SEARCH_FOUND
+
+        automaton.assert_not_called()
+
+
+class TestCalculateSectionMatches:
+    """Test _calculate_section_matches function."""
+
+    def test_buckets_match_per_pair_scoring(self) -> None:
+        """Test native batch scoring buckets sections as per-pair scoring did."""
+        rng = np.random.default_rng(10)
+        words = ["archive", "backup", "cron", "night", "service", "storage", "phase", "plan", "guide", "rotate", "job"]
+        targets = [" ".join(rng.choice(words, size=rng.integers(4, 10))) for _ in range(12)]
+        sections = []
+        for _ in range(60):
+            section = targets[rng.integers(len(targets))].split()
+            for _ in range(rng.integers(0, 7)):
+                section[rng.integers(len(section))] = words[rng.integers(len(words))]
+            if rng.random() < 0.3:
+                section.reverse()
+            sections.append(" ".join(section))
+        matched_content = "\n\n".join(targets)
+
+        expected = per_pair_section_matches(sections, matched_content, targets)
+
+        assert reports._calculate_section_matches(sections, matched_content, targets) == expected
+        # The comparison must cover every bucket to mean anything
+        assert expected[0] > 0
+        assert expected[1]
+        assert expected[2]
+
+    def test_no_target_sections(self) -> None:
+        """Test sections are only matched verbatim when the target has no sections."""
+        sections = [SHARED_SECTION, FUZZY_SECTION]
+
+        assert reports._calculate_section_matches(sections, SHARED_SECTION, []) == (1, [], [])
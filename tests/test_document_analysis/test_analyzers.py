@@ -5,6 +5,7 @@ Comprehensive tests for document discovery and content loading utilities,
 ensuring compliance with CLAUDE.md testing standards.
 """
 
+import os
 import tempfile
 from pathlib import Path
 from typing import Any, cast
@@ -13,11 +14,15 @@ from unittest.mock import patch
 import pytest
 
 from src.document_analysis.analyzers import (
+    clear_document_cache,
+    count_documents_by_type,
     find_active_documents,
     find_not_in_use_documents,
+    load_markdown_files,
     should_exclude,
 )
-from src.document_analysis.validation import ValidationError
+from src.document_analysis.config import DEFAULT_EXCLUDE_PATTERNS
+from src.document_analysis.validation import ValidationError, validate_file_path
 
 
 # Placeholder functions for tests
@@ -89,6 +94,23 @@ class TestShouldExclude:
 
         assert result is True
 
+    def test_should_exclude_wildcard_pattern(self) -> None:
+        """Test that '*' in a pattern matches any run of characters."""
+        exclude_patterns = ["*.egg-info"]
+
+        assert should_exclude(Path("pkg.egg-info/readme.md"), exclude_patterns) is True
+        assert should_exclude(Path("pkg/readme.md"), exclude_patterns) is False
+
+    def test_should_exclude_default_patterns(self) -> None:
+        """Test matching against the default exclude pattern set."""
+        assert should_exclude(Path(".venv/lib/readme.md"), DEFAULT_EXCLUDE_PATTERNS) is True
+        assert should_exclude(Path("docs/readme.md"), DEFAULT_EXCLUDE_PATTERNS) is False
+
+    def test_should_exclude_escapes_regex_characters(self) -> None:
+        """Test that regex metacharacters in patterns are matched literally."""
+        assert should_exclude(Path("docs/a+b/readme.md"), ["a+b"]) is True
+        assert should_exclude(Path("docs/aab/readme.md"), ["a+b"]) is False
+
 
 class TestFindActiveDocuments:
     """Test cases for find_active_documents function."""
@@ -141,6 +163,23 @@ class TestFindActiveDocuments:
             assert len(result) == 1
             assert result[0].suffix == ".txt"
 
+    def test_find_active_documents_skips_symlinked_and_excluded_dirs(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that excluded and symlinked directories are not descended into."""
+        monkeypatch.chdir(tmp_path)
+        clear_document_cache()
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "guide.md").write_text("# Guide")
+        (tmp_path / "docs" / "notes.txt").write_text("Notes")
+        (tmp_path / ".venv").mkdir()
+        (tmp_path / ".venv" / "readme.md").write_text("# Vendored")
+        (tmp_path / "linked").symlink_to(tmp_path / "docs", target_is_directory=True)
+
+        result = find_active_documents(root_dir=tmp_path, verbose=False)
+
+        assert result == [(tmp_path / "docs" / "guide.md").resolve()]
+
     def test_find_active_documents_verbose_mode(self) -> None:
         """Test verbose mode output."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -154,6 +193,77 @@ class TestFindActiveDocuments:
                 mock_log.assert_called()
 
 
+class TestFindActiveDocumentsCache:
+    """Test cases for the find_active_documents result cache."""
+
+    def test_cache_reused_while_root_unchanged(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a repeated call is served without walking the tree."""
+        monkeypatch.chdir(tmp_path)
+        clear_document_cache()
+        (tmp_path / "test.md").write_text("# Test")
+
+        first = find_active_documents(root_dir=tmp_path, verbose=False)
+        with patch("src.document_analysis.analyzers.os.scandir", side_effect=AssertionError("tree walked")):
+            second = find_active_documents(root_dir=tmp_path, verbose=False)
+
+        assert first == second
+        assert len(second) == 1
+
+    def test_cache_invalidated_on_root_change(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that adding a file to the root invalidates the cache."""
+        monkeypatch.chdir(tmp_path)
+        clear_document_cache()
+        (tmp_path / "first.md").write_text("# First")
+        assert len(find_active_documents(root_dir=tmp_path, verbose=False)) == 1
+
+        (tmp_path / "second.md").write_text("# Second")
+
+        assert len(find_active_documents(root_dir=tmp_path, verbose=False)) == 2
+
+    def test_cache_invalidated_on_nested_change(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that adding or removing a file below the root invalidates the cache."""
+        monkeypatch.chdir(tmp_path)
+        clear_document_cache()
+        sub_dir = tmp_path / "docs" / "sub"
+        sub_dir.mkdir(parents=True)
+        (sub_dir / "a.md").write_text("# A")
+        assert find_active_documents(root_dir=tmp_path, verbose=False) == [(sub_dir / "a.md").resolve()]
+
+        (sub_dir / "b.md").write_text("# B")
+        assert len(find_active_documents(root_dir=tmp_path, verbose=False)) == 2
+
+        (sub_dir / "a.md").unlink()
+        assert find_active_documents(root_dir=tmp_path, verbose=False) == [(sub_dir / "b.md").resolve()]
+
+    def test_cache_not_shared_across_working_directories(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a result cached under one working directory is not served under another."""
+        monkeypatch.chdir(tmp_path)
+        clear_document_cache()
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        (docs_dir / "test.md").write_text("# Test")
+        first = find_active_documents(root_dir=docs_dir, verbose=False)
+
+        monkeypatch.chdir(docs_dir)
+        with patch("src.document_analysis.analyzers.os.scandir", wraps=os.scandir) as scandir:
+            second = find_active_documents(root_dir=docs_dir, verbose=False)
+
+        scandir.assert_called()
+        assert second == first
+
+    def test_cached_result_is_a_copy(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that mutating a returned list does not corrupt the cache."""
+        monkeypatch.chdir(tmp_path)
+        clear_document_cache()
+        (tmp_path / "test.md").write_text("# Test")
+
+        find_active_documents(root_dir=tmp_path, verbose=False).clear()
+
+        assert len(find_active_documents(root_dir=tmp_path, verbose=False)) == 1
+
+
 class TestFindNotInUseDocuments:
     """Test cases for find_not_in_use_documents function."""
 
@@ -181,6 +291,101 @@ class TestFindNotInUseDocuments:
             assert result == []
 
 
+class TestCountDocumentsByType:
+    """Test cases for count_documents_by_type function."""
+
+    def test_count_documents_by_type_categories(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that each document is counted in exactly one category."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "active.md").write_text("# Active")
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "guide.md").write_text("# Guide")
+        (tmp_path / "not_in_use").mkdir()
+        (tmp_path / "not_in_use" / "old.md").write_text("# Old")
+        (tmp_path / "not_in_use_backup_1" / "nested").mkdir(parents=True)
+        (tmp_path / "not_in_use_backup_1" / "nested" / "backup.md").write_text("# Backup")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "ignored.md").write_text("# Ignored")
+
+        counts = count_documents_by_type(tmp_path)
+
+        assert counts == {
+            "active_documents": 2,
+            "not_in_use_documents": 1,
+            "backup_documents": 1,
+            "total_documents": 4,
+        }
+
+
+class TestLoadMarkdownFiles:
+    """Test cases for load_markdown_files validation caching."""
+
+    def test_invalid_path_cached_until_directory_changes(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a rejected path is skipped until a file appears in its directory."""
+        monkeypatch.chdir(tmp_path)
+        clear_document_cache()
+        doc = tmp_path / "late.md"
+
+        with patch("src.document_analysis.analyzers.validate_file_path", wraps=validate_file_path) as mock_validate:
+            assert load_markdown_files([doc], tmp_path) == {}
+            assert load_markdown_files([doc], tmp_path) == {}
+            assert mock_validate.call_count == 1
+
+            doc.write_text("# Late")
+            # Directory mtimes can be coarse; make sure the creation is visible
+            dir_stat = tmp_path.stat()
+            os.utime(tmp_path, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns + 1_000_000))
+            assert load_markdown_files([doc], tmp_path) == {"late.md": "# Late"}
+            assert mock_validate.call_count == 2
+
+    def test_invalid_path_revalidated_when_file_changes(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a file rejected as too large is accepted once truncated in place."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr("src.document_analysis.validation.MAX_FILE_SIZE_MB", 50 / (1024 * 1024))
+        clear_document_cache()
+        doc = tmp_path / "big.md"
+        doc.write_text("#" * 100)
+        dir_stat = tmp_path.stat()
+
+        assert load_markdown_files([doc], tmp_path) == {}
+
+        with doc.open("r+") as f:
+            f.truncate(10)
+        # Truncation leaves the directory alone; pin its mtime so only the file differs
+        os.utime(tmp_path, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+        assert load_markdown_files([doc], tmp_path) == {"big.md": "#" * 10}
+
+    def test_valid_path_revalidated_only_on_change(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that unchanged files skip full validation on repeated loads."""
+        monkeypatch.chdir(tmp_path)
+        clear_document_cache()
+        doc = tmp_path / "doc.md"
+        doc.write_text("# One")
+
+        with patch("src.document_analysis.analyzers.validate_file_path", wraps=validate_file_path) as mock_validate:
+            load_markdown_files([doc], tmp_path)
+            load_markdown_files([doc], tmp_path)
+            assert mock_validate.call_count == 1
+
+            doc.write_text("# Two, longer")
+            os.utime(doc, ns=(doc.stat().st_atime_ns, doc.stat().st_mtime_ns + 1_000_000))
+            assert load_markdown_files([doc], tmp_path) == {"doc.md": "# Two, longer"}
+            assert mock_validate.call_count == 2
+
+    def test_duplicate_paths_read_once(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a file listed more than once is read only once."""
+        monkeypatch.chdir(tmp_path)
+        clear_document_cache()
+        doc = tmp_path / "doc.md"
+        doc.write_text("# Doc")
+
+        with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as mock_read:
+            files = load_markdown_files([doc, Path("doc.md"), doc], tmp_path)
+
+        assert files == {"doc.md": "# Doc"}
+        assert mock_read.call_count == 1
+
+
 class TestLoadDocumentContent:
     """Test cases for load_document_content function."""
 
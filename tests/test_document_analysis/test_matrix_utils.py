@@ -15,9 +15,12 @@ import pytest
 from src.document_analysis.similarity.matrix_utils import (
     convert_matrix_format,
     create_empty_matrix,
+    create_empty_matrix_np,
     filter_matrix_by_threshold,
+    filter_matrix_by_threshold_batch,
     find_clusters_in_matrix,
     get_matrix_stats,
+    get_matrix_stats_batch,
     normalize_matrix,
 )
 from src.document_analysis.validation import ValidationError
@@ -82,6 +85,15 @@ class TestCreateEmptyMatrix:
         assert len(matrix) == 100
         assert len(matrix[0]) == 100
 
+    def test_create_matrix_np(self) -> None:
+        """Test the array form matches the list form."""
+        matrix = create_empty_matrix_np(3, fill_value=0.5)
+
+        assert isinstance(matrix, np.ndarray)
+        assert matrix.dtype == np.float32
+        assert matrix.tolist() == create_empty_matrix(3, fill_value=0.5)
+        assert create_empty_matrix_np(2, dtype=np.float64).dtype == np.float64
+
     def test_create_matrix_logging(self) -> None:
         """Test that matrix creation logs debug info."""
         with patch("src.document_analysis.similarity.matrix_utils.logger") as mock_logger:
@@ -238,6 +250,16 @@ class TestFindClustersInMatrix:
         assert len(clusters) == 1
         assert sorted(clusters[0]) == [0, 1]
 
+    def test_find_clusters_transitive(self) -> None:
+        """Test that chained similarities form one cluster."""
+        matrix = pd.DataFrame([
+            [1.0, 0.9, 0.1],
+            [0.9, 1.0, 0.85],
+            [0.1, 0.85, 1.0]
+        ])
+
+        assert find_clusters_in_matrix(matrix, threshold=0.8) == [[0, 1, 2]]
+
     def test_find_clusters_no_clusters(self) -> None:
         """Test when no clusters exist above threshold."""
         matrix = [
@@ -443,6 +465,40 @@ class TestFilterMatrixByThreshold:
         assert filtered.loc['A', 'B'] == 0.0
         assert filtered.loc['A', 'C'] == 0.9
 
+    def test_filter_input_types_agree(self) -> None:
+        """Test that lists, arrays and DataFrames filter identically without touching the input."""
+        values = [[0.2, 0.4, 0.9], [0.4, 0.7, 0.3], [0.9, 0.3, 0.6]]
+        array = np.array(values)
+        frame = pd.DataFrame(values)
+
+        expected = [[1.0, 0.0, 0.9], [0.0, 1.0, 0.0], [0.9, 0.0, 1.0]]
+        assert filter_matrix_by_threshold(values, threshold=0.5) == expected
+        assert filter_matrix_by_threshold(array, threshold=0.5).tolist() == expected
+        assert filter_matrix_by_threshold(frame, threshold=0.5).to_numpy().tolist() == expected
+        assert array[0, 1] == 0.4 and frame.iloc[0, 1] == 0.4
+
+    def test_filter_keeps_float32(self) -> None:
+        """Test that float32 matrices are not upcast by filtering or normalization."""
+        matrix = create_empty_matrix_np(3, fill_value=0.6)
+
+        assert filter_matrix_by_threshold(matrix, threshold=0.5).dtype == np.float32
+        assert normalize_matrix(matrix, "minmax").dtype == np.float32
+
+    def test_filter_non_finite_scores(self) -> None:
+        """Test that -inf scores become 0 and NaN scores are kept, as with np.where."""
+        matrix = np.array([[1.0, -np.inf, np.nan], [0.7, 1.0, -0.2], [np.inf, 0.3, 1.0]])
+        expected = np.where(matrix < 0.5, 0.0, matrix)
+
+        with np.errstate(invalid="raise"):
+            filtered = filter_matrix_by_threshold(matrix, threshold=0.5)
+            batch = filter_matrix_by_threshold_batch(np.stack([matrix, matrix[::-1, ::-1]]), threshold=0.5)
+
+        np.testing.assert_array_equal(filtered, expected)
+        assert filtered[0, 1] == 0.0
+        assert np.isnan(filtered[0, 2])
+        np.testing.assert_array_equal(batch[0], expected)
+        np.testing.assert_array_equal(batch[1], np.where(matrix[::-1, ::-1] < 0.5, 0.0, matrix[::-1, ::-1]))
+
     def test_filter_threshold_zero(self) -> None:
         """Test filtering with threshold 0.0."""
         matrix = [[1.0, 0.1], [0.1, 1.0]]
@@ -480,6 +536,43 @@ class TestFilterMatrixByThreshold:
             filter_matrix_by_threshold("not a matrix", threshold=0.5)  # type: ignore
 
 
+class TestBatchFunctions:
+    """Test get_matrix_stats_batch and filter_matrix_by_threshold_batch."""
+
+    def test_batch_matches_single(self) -> None:
+        """Test that each batch entry equals the single-matrix result."""
+        rng = np.random.default_rng(0)
+        stack = rng.random((3, 6, 6))
+
+        batch_stats = get_matrix_stats_batch(stack)
+        filtered = filter_matrix_by_threshold_batch(stack, threshold=0.5)
+
+        for i in range(3):
+            stats = get_matrix_stats(stack[i])
+            assert batch_stats["size"] == stats["size"]
+            assert batch_stats["total_pairs"] == stats["total_pairs"]
+            for key in ["mean", "std", "min", "max", "median", "percentile_25", "percentile_75"]:
+                assert batch_stats[key][i] == pytest.approx(stats[key])
+            for key in ["high_similarity", "medium_similarity", "low_similarity"]:
+                assert batch_stats[key][i] == stats[key]
+            assert np.array_equal(filtered[i], filter_matrix_by_threshold(stack[i], threshold=0.5))
+
+    def test_batch_single_item(self) -> None:
+        """Test a stack of 1x1 matrices."""
+        stats = get_matrix_stats_batch(np.ones((2, 1, 1)))
+
+        assert stats["total_pairs"] == 0
+        assert stats["mean"].tolist() == [0.0, 0.0]
+
+    def test_batch_invalid_stack(self) -> None:
+        """Test error handling for stacks that are not 3D square."""
+        with pytest.raises(ValidationError, match="3D array of square matrices"):
+            get_matrix_stats_batch(np.ones((2, 2)))
+
+        with pytest.raises(ValidationError, match="3D array of square matrices"):
+            filter_matrix_by_threshold_batch(np.ones((2, 2, 3)), threshold=0.5)
+
+
 class TestConvertMatrixFormat:
     """Test convert_matrix_format function."""
 
@@ -554,6 +647,11 @@ class TestConvertMatrixFormat:
         with pytest.raises(ValidationError, match="Unsupported input matrix type"):
             convert_matrix_format("not a matrix", "numpy")  # type: ignore
 
+    def test_convert_invalid_list(self) -> None:
+        """Test that a non-numeric list raises ValidationError like the other helpers."""
+        with pytest.raises(ValidationError, match="Invalid matrix format"):
+            convert_matrix_format([[1.0, "x"], ["x", 1.0]], "numpy")
+
     def test_convert_mismatched_labels(self) -> None:
         """Test error handling for mismatched labels."""
         matrix = [[1.0, 0.5], [0.5, 1.0]]
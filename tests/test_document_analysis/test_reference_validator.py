@@ -4,9 +4,10 @@
 Comprehensive tests for reference validation according to CLAUDE.md standards.
 """
 
+import os
 import re
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock, Mock, mock_open, patch
 
 import pytest
 
@@ -96,20 +97,61 @@ class TestNormalizePath:
                 result = validator.normalize_path("../../../outside/file.md", from_dir)
                 assert result == "../../../outside/file.md"
 
-    def test_normalize_path_planning_directory_check(self) -> None:
+    def test_normalize_path_planning_directory_check(self, tmp_path: Path) -> None:
         """Test auto-detection of planning directory files."""
-        root = Path("/test/root")
-        validator = ReferenceValidator(root_dir=root, enhanced_mode=True)
-        
-        # Mock planning directory existence
+        (tmp_path / "planning").mkdir()
+        (tmp_path / "planning" / "TASK.md").write_text("# Task")
+        validator = ReferenceValidator(root_dir=tmp_path, enhanced_mode=True)
+
+        assert validator.normalize_path("TASK.md") == "planning/TASK.md"
+        assert validator.normalize_path("README.md") == "README.md"
+
+        # Nested paths are still checked against the filesystem
         with patch.object(Path, "exists") as mock_exists:
             mock_exists.return_value = True
-            result = validator.normalize_path("TASK.md")
-            assert result == "planning/TASK.md"
-            
+            result = validator.normalize_path("sub/NOTES.md")
+            assert result == "planning/sub/NOTES.md"
+
             # Verify exists was called
             assert mock_exists.called
 
+    def test_normalize_path_memoized(self, tmp_path: Path) -> None:
+        """Test that repeated (path, from_dir) pairs are normalized only once."""
+        (tmp_path / "planning").mkdir()
+        (tmp_path / "planning" / "TASK.md").write_text("# Task")
+        validator = ReferenceValidator(root_dir=tmp_path, enhanced_mode=True)
+
+        with patch("src.document_analysis.reference_validator.os.scandir", wraps=os.scandir) as mock_scandir:
+            assert validator.normalize_path("TASK.md") == "planning/TASK.md"
+            assert validator.normalize_path("TASK.md", tmp_path) == "planning/TASK.md"
+            assert validator.normalize_path("OTHER.md") == "OTHER.md"
+            assert mock_scandir.call_count == 1  # planning/ is listed once for all lookups
+
+        assert validator.normalize_path("../README.md", tmp_path / "docs") == "README.md"
+        assert validator.normalize_path("../README.md", tmp_path / "docs") == "README.md"
+        assert len(validator._norm_cache) == 3
+
+    def test_normalize_path_is_lexical(self) -> None:
+        """Test that ../ paths are normalized without resolving symlinks on disk."""
+        root = Path("/test/root")
+        validator = ReferenceValidator(root_dir=root, enhanced_mode=True)
+
+        with patch.object(Path, "resolve", side_effect=AssertionError("resolve() must not be called")):
+            assert validator.normalize_path("../guide/../README.md", root / "docs") == "README.md"
+            assert validator.normalize_path("../../root2/x.md", root / "docs") == "../../root2/x.md"
+            assert validator.normalize_path("../", root / "docs") == "."
+
+    def test_normalize_path_interns_results(self) -> None:
+        """Test that equal normalized paths share a single string object."""
+        root = Path("/test/root")
+        validator = ReferenceValidator(root_dir=root, enhanced_mode=True)
+
+        from_docs = validator.normalize_path("../README.md", root / "docs")
+        from_planning = validator.normalize_path("../README.md", root / "planning")
+
+        assert from_docs == "README.md"
+        assert from_docs is from_planning
+
 
 class TestExtractReferencesFromMap:
     """Test extraction of references from DOCUMENT_REFERENCE_MAP.md."""
@@ -140,7 +182,7 @@ class TestExtractReferencesFromMap:
 """
         
         with patch.object(Path, "exists", return_value=True):
-            with patch.object(Path, "read_text", return_value=content):
+            with patch.object(Path, "open", mock_open(read_data=content)):
                 references = validator.extract_references_from_map()
                 
                 assert "README.md" in references
@@ -161,7 +203,7 @@ class TestExtractReferencesFromMap:
 """
         
         with patch.object(Path, "exists", return_value=True):
-            with patch.object(Path, "read_text", return_value=content):
+            with patch.object(Path, "open", mock_open(read_data=content)):
                 with patch.object(validator, "normalize_path") as mock_normalize:
                     mock_normalize.side_effect = lambda p, d: p  # Return path as-is
                     
@@ -188,7 +230,7 @@ class TestExtractReferencesFromMap:
 """
         
         with patch.object(Path, "exists", return_value=True):
-            with patch.object(Path, "read_text", return_value=content):
+            with patch.object(Path, "open", mock_open(read_data=content)):
                 references = validator.extract_references_from_map()
                 
                 # Should only extract valid markdown references
@@ -227,7 +269,7 @@ Image link ![Logo](logo.png).
 """
         
         with patch.object(Path, "exists", return_value=True):
-            with patch.object(Path, "read_text", return_value=content):
+            with patch.object(Path, "read_bytes", return_value=content.encode()):
                 references = validator.extract_references_from_document(doc_path)
                 
                 assert references == {"PLANNING.md", "docs/guide.md"}
@@ -247,7 +289,7 @@ Image link ![Logo](logo.png).
 """
         
         with patch.object(Path, "exists", return_value=True):
-            with patch.object(Path, "read_text", return_value=content):
+            with patch.object(Path, "read_bytes", return_value=content.encode()):
                 with patch.object(Path, "parent", new_callable=lambda: Mock(return_value=Path("/test/docs"))):
                     with patch.object(validator, "normalize_path") as mock_normalize:
                         mock_normalize.side_effect = lambda p, d: f"normalized_{p}"
@@ -272,7 +314,7 @@ Image link ![Logo](logo.png).
 """
         
         with patch.object(Path, "exists", return_value=True):
-            with patch.object(Path, "read_text", return_value=content):
+            with patch.object(Path, "read_bytes", return_value=content.encode()):
                 references = validator.extract_references_from_document(doc_path)
                 
                 # In basic mode, paths are returned as-is
@@ -281,8 +323,29 @@ Image link ![Logo](logo.png).
                 assert "link3.md" in references
                 assert "link4.md" in references
                 assert "path with spaces.md" in references
-                # Note: doc.md#section doesn't end with .md so it's not included
-                assert len(references) == 5
+                # The fragment is dropped so the link counts as a reference to doc.md
+                assert "doc.md" in references
+                assert len(references) == 6
+
+    def test_extract_references_ignores_non_markdown_targets(self) -> None:
+        """Test that links whose target is not a .md file are never captured."""
+        validator = ReferenceValidator(enhanced_mode=False)
+        content = "[Google](https://google.com) and ![Logo](logo.png) and [notes](notes.md.txt)"
+
+        assert validator.extract_references_from_document(Path("/test/doc.md"), content=content) == set()
+
+    def test_extract_references_scans_undecoded_bytes(self) -> None:
+        """Test that link extraction decodes only the captured targets."""
+        validator = ReferenceValidator(enhanced_mode=False)
+        doc_path = Path("/test/doc.md")
+        raw = "Prose café ☕ [guide](guía.md) [site](https://example.com)".encode()
+
+        with patch.object(Path, "exists", return_value=True):
+            with patch.object(Path, "read_bytes", return_value=raw):
+                references = validator.extract_references_from_document(doc_path)
+
+        assert references == {"guía.md"}
+        assert validator._content_cache == {}  # Full text is decoded only when needed
 
 
 class TestValidateDocumentPresence:
@@ -333,6 +396,38 @@ class TestValidateDocumentPresence:
                 assert presence["planning/PLANNING.md"] is True
                 assert presence["docs/guide.md"] is False
 
+    def test_validate_document_presence_stats_each_path_once(self) -> None:
+        """Test that repeated references reuse the cached filesystem probe."""
+        validator = ReferenceValidator(root_dir=Path("/test"), enhanced_mode=True)
+
+        references = {
+            "README.md": ["planning/PLANNING.md"],
+            "CLAUDE.md": ["planning/PLANNING.md"],
+        }
+
+        with patch.object(Path, "exists", return_value=True) as mock_exists:
+            with patch.object(Path, "is_file", return_value=True) as mock_is_file:
+                presence = validator.validate_document_presence(references)
+                presence = validator.validate_document_presence(references)
+
+        assert presence == {"planning/PLANNING.md": True}
+        assert mock_exists.call_count == 1
+        assert mock_is_file.call_count == 1
+
+    def test_validate_document_presence_uses_document_index(self) -> None:
+        """Test that indexed documents are found without touching the filesystem."""
+        root = Path("/test")
+        validator = ReferenceValidator(root_dir=root, enhanced_mode=True)
+        validator._build_index([root / "planning" / "PLANNING.md", Path("/elsewhere/OTHER.md")])
+
+        references = {"README.md": ["planning/PLANNING.md", "docs/guide.md"]}
+
+        with patch.object(Path, "exists", return_value=False) as mock_exists:
+            presence = validator.validate_document_presence(references)
+
+        assert presence == {"planning/PLANNING.md": True, "docs/guide.md": False}
+        assert mock_exists.call_count == 1  # Only the unindexed reference is probed
+
 
 class TestValidateLinkCorrectness:
     """Test link correctness validation."""
@@ -407,7 +502,7 @@ Also check [missing section](#non-existent).
         mock_doc = Path("/test/doc.md")
         
         with patch("src.document_analysis.reference_validator.find_active_documents", return_value=[mock_doc]):
-            with patch.object(Path, "read_text", return_value=content):
+            with patch.object(Path, "read_bytes", return_value=content.encode()):
                 issues = validator.check_internal_coherence()
                 
                 assert "doc.md" in issues
@@ -432,7 +527,7 @@ XXX: Temporary hack
         mock_doc = Path("/test/doc.md")
         
         with patch("src.document_analysis.reference_validator.find_active_documents", return_value=[mock_doc]):
-            with patch.object(Path, "read_text", return_value=content):
+            with patch.object(Path, "read_bytes", return_value=content.encode()):
                 issues = validator.check_internal_coherence()
                 
                 assert "doc.md" in issues
@@ -442,13 +537,35 @@ XXX: Temporary hack
                 assert any("PLACEHOLDER" in issue for issue in issues["doc.md"])
                 assert any("TBD" in issue for issue in issues["doc.md"])
 
+    def test_check_internal_coherence_overlapping_matches(self) -> None:
+        """Test that one scan still reports matches that overlap across kinds."""
+        validator = ReferenceValidator()
+
+        content = """# TODO: Write intro
+See [TBD](#todo-write-intro) and [gone](#missing). FIXME: tidy [wip note]
+"""
+
+        mock_doc = Path("/test/doc.md")
+
+        with patch("src.document_analysis.reference_validator.find_active_documents", return_value=[mock_doc]):
+            with patch.object(Path, "read_bytes", return_value=content.encode()):
+                issues = validator.check_internal_coherence()
+
+        assert issues["doc.md"] == [
+            "Broken section reference: #missing",
+            "TODO: Write intro",
+            "FIXME: tidy [wip note]",
+            "Placeholder content: [TBD]",
+            "Placeholder content: [wip note]",
+        ]
+
     def test_check_internal_coherence_read_error(self) -> None:
         """Test handling of file read errors."""
         validator = ReferenceValidator()
         mock_doc = Path("/test/doc.md")
         
         with patch("src.document_analysis.reference_validator.find_active_documents", return_value=[mock_doc]):
-            with patch.object(Path, "read_text", side_effect=OSError("Permission denied")):
+            with patch.object(Path, "read_bytes", side_effect=OSError("Permission denied")):
                 issues = validator.check_internal_coherence()
                 
                 assert "doc.md" in issues
@@ -469,7 +586,7 @@ XXX: Temporary hack
         mock_doc = Path("/test/doc.md")
         
         with patch("src.document_analysis.reference_validator.find_active_documents", return_value=[mock_doc]):
-            with patch.object(Path, "read_text", return_value=content):
+            with patch.object(Path, "read_bytes", return_value=content.encode()):
                 issues = validator.check_internal_coherence()
                 
                 # Should not report issues for correctly normalized anchors
@@ -529,6 +646,57 @@ class TestValidateCrossReferences:
                     assert "EXISTS.md" not in invalid_refs.get("README.md", [])
 
 
+class TestSharedDocumentReads:
+    """Test that per-document checks share a single read of each file."""
+
+    def test_checks_read_each_document_once(self) -> None:
+        """Test link, cross-reference and coherence checks reuse loaded content."""
+        root = Path("/test")
+        validator = ReferenceValidator(root_dir=root, enhanced_mode=True)
+        all_docs = [root / "README.md"]
+
+        with patch("src.document_analysis.reference_validator.find_active_documents") as mock_find:
+            with patch.object(Path, "exists", return_value=True):
+                with patch.object(Path, "is_file", return_value=True):
+                    with patch.object(Path, "read_bytes", return_value=b"See [guide](docs/guide.md)\nTODO: x") as mock_read:
+                        link_status = validator.validate_link_correctness(all_docs)
+                        invalid_refs = validator.validate_cross_references(all_docs)
+                        issues = validator.check_internal_coherence(all_docs)
+
+        assert link_status["README.md"]["references"] == ["docs/guide.md"]
+        assert invalid_refs == {}
+        assert issues == {"README.md": ["TODO: x"]}
+        assert mock_read.call_count == 1
+        mock_find.assert_not_called()
+
+    def test_checks_discover_documents_once(self) -> None:
+        """Test that checks called without all_docs share one document discovery."""
+        validator = ReferenceValidator(root_dir=Path("/test"), enhanced_mode=True)
+
+        with patch("src.document_analysis.reference_validator.find_active_documents", return_value=[]) as mock_find:
+            validator.validate_link_correctness()
+            validator.validate_cross_references()
+            validator.check_internal_coherence()
+
+        mock_find.assert_called_once()
+
+    def test_relative_names_computed_once(self) -> None:
+        """Test that each document's root-relative name is derived only once."""
+        root = Path("/test")
+        validator = ReferenceValidator(root_dir=root, enhanced_mode=True)
+        all_docs = [root / "docs" / "guide.md"]
+
+        with patch.object(validator, "extract_references_from_document", return_value={"MISSING.md"}):
+            with patch.object(Path, "exists", return_value=False):
+                with patch.object(Path, "relative_to", wraps=lambda other: Path("docs/guide.md")) as mock_rel:
+                    link_status = validator.validate_link_correctness(all_docs)
+                    invalid_refs = validator.validate_cross_references(all_docs)
+
+        assert link_status["docs/guide.md"]["path"] == "docs/guide.md"
+        assert invalid_refs == {"docs/guide.md": ["MISSING.md"]}
+        assert mock_rel.call_count == 1
+
+
 class TestGenerateValidationReport:
     """Test validation report generation."""
 
@@ -564,6 +732,8 @@ class TestGenerateValidationReport:
                                 log_messages = [call[0][0] for call in mock_logger.info.call_args_list]
                                 assert any("DOCUMENT REFERENCE VALIDATION REPORT" in msg for msg in log_messages)
                                 assert not any("ENHANCED" in msg for msg in log_messages)
+                                # Lines are batched into one record per report section
+                                assert mock_logger.info.call_count <= 6
 
     def test_generate_report_enhanced_mode_full(self) -> None:
         """Test comprehensive report generation in enhanced mode."""
@@ -721,7 +891,7 @@ class TestReferenceValidatorEdgeCases:
         doc_path = Path("/test/empty.md")
         
         with patch.object(Path, "exists", return_value=True):
-            with patch.object(Path, "read_text", return_value=""):
+            with patch.object(Path, "read_bytes", return_value=b""):
                 references = validator.extract_references_from_document(doc_path)
                 assert references == set()
 
@@ -738,7 +908,7 @@ class TestReferenceValidatorEdgeCases:
 """
         
         with patch.object(Path, "exists", return_value=True):
-            with patch.object(Path, "read_text", return_value=content):
+            with patch.object(Path, "read_bytes", return_value=content.encode()):
                 references = validator.extract_references_from_document(doc_path)
                 # Should handle malformed links gracefully
                 assert isinstance(references, set)
@@ -755,7 +925,7 @@ class TestReferenceValidatorEdgeCases:
 """
         
         with patch.object(Path, "exists", return_value=True):
-            with patch.object(Path, "read_text", return_value=content):
+            with patch.object(Path, "read_bytes", return_value=content.encode()):
                 references = validator.extract_references_from_document(doc_path)
                 
                 # In enhanced mode, paths get normalized
@@ -13,11 +13,13 @@ from unittest.mock import MagicMock, Mock, patch, PropertyMock
 import numpy as np
 import pandas as pd
 import pytest
+import torch
 
 from src.document_analysis.similarity.semantic_similarity import (
     SemanticSimilarityCalculator,
     analyze_active_document_similarities,
     analyze_semantic_similarity,
+    clear_model_cache,
     create_similarity_matrix,
     find_embeddings_clusters,
 )
@@ -31,6 +33,14 @@ def mock_allowed_paths(monkeypatch):
     monkeypatch.setattr("src.document_analysis.validation.ALLOWED_BASE_PATHS", frozenset())
 
 
+@pytest.fixture(autouse=True)
+def clear_shared_models():
+    """Keep models loaded by the legacy functions from leaking between tests."""
+    clear_model_cache()
+    yield
+    clear_model_cache()
+
+
 class MockTensor:
     """Mock torch tensor for testing."""
     
@@ -58,7 +68,7 @@ def mock_sentence_transformer():
         model = MagicMock()
         
         # Mock encode method to return predictable embeddings
-        def encode_side_effect(texts, convert_to_tensor=False, show_progress_bar=True):
+        def encode_side_effect(texts, convert_to_tensor=False, show_progress_bar=True, pool=None):
             if isinstance(texts, str):
                 texts = [texts]
             
@@ -185,7 +195,91 @@ class TestSemanticSimilarityCalculator:
         
         assert model is not None
         assert calc._model is not None
-        mock_sentence_transformer.assert_called_once_with("test-model")
+        mock_sentence_transformer.assert_called_once_with("test-model", device=None, backend="torch")
+
+    def test_model_device(self, mock_sentence_transformer) -> None:
+        """Test an explicit device is passed to SentenceTransformer."""
+        calc = SemanticSimilarityCalculator(model_name="test-model", device="cpu")
+
+        model = calc.model
+
+        assert model is mock_sentence_transformer.return_value
+        assert calc.device == "cpu"
+        mock_sentence_transformer.assert_called_once_with("test-model", device="cpu", backend="torch")
+
+    def test_model_fp16(self, mock_sentence_transformer) -> None:
+        """Test fp16 precision halves the model on CUDA only."""
+        mock_sentence_transformer.return_value.device.type = "cuda"
+        SemanticSimilarityCalculator(precision="fp16").model.half.assert_called_once()
+
+        mock_sentence_transformer.return_value.device.type = "cpu"
+        mock_sentence_transformer.return_value.half.reset_mock()
+        SemanticSimilarityCalculator(precision="fp16").model.half.assert_not_called()
+
+        with pytest.raises(ValidationError, match="Unsupported precision"):
+            SemanticSimilarityCalculator(precision="int8")
+
+    def test_model_backend(self, mock_sentence_transformer) -> None:
+        """Test the inference backend is passed through and validated."""
+        model = SemanticSimilarityCalculator(model_name="test-model", backend="onnx").model
+
+        assert model is mock_sentence_transformer.return_value
+        mock_sentence_transformer.assert_called_once_with("test-model", device=None, backend="onnx")
+
+        with pytest.raises(ValidationError, match="Unsupported backend"):
+            SemanticSimilarityCalculator(backend="tensorrt")
+
+        with pytest.raises(ValidationError, match="requires the torch backend"):
+            SemanticSimilarityCalculator(backend="onnx", precision="fp16")
+
+    def test_model_num_threads(self, mock_sentence_transformer) -> None:
+        """Test num_threads sets torch's CPU thread count when the model loads."""
+        with patch("src.document_analysis.similarity.semantic_similarity.torch.set_num_threads") as set_num_threads:
+            calculator = SemanticSimilarityCalculator(num_threads=4)
+            set_num_threads.assert_not_called()
+
+            model = calculator.model
+            assert model is mock_sentence_transformer.return_value
+            set_num_threads.assert_called_once_with(4)
+
+            model = SemanticSimilarityCalculator().model
+            assert model is mock_sentence_transformer.return_value
+            set_num_threads.assert_called_once()
+
+        with pytest.raises(ValidationError, match="positive integer"):
+            SemanticSimilarityCalculator(num_threads=0)
+
+    def test_share_model(self, mock_sentence_transformer) -> None:
+        """Test sharing calculators load a model once until the cache is cleared."""
+        first = SemanticSimilarityCalculator(model_name="test-model", share_model=True).model
+        second = SemanticSimilarityCalculator(model_name="test-model", share_model=True).model
+        unshared = SemanticSimilarityCalculator(model_name="test-model").model
+
+        assert first is second
+        assert unshared is mock_sentence_transformer.return_value
+        assert mock_sentence_transformer.call_count == 2
+
+        clear_model_cache()
+        reloaded = SemanticSimilarityCalculator(model_name="test-model", share_model=True).model
+        assert reloaded is mock_sentence_transformer.return_value
+        assert mock_sentence_transformer.call_count == 3
+
+        with pytest.raises(ValidationError, match="share_model requires"):
+            SemanticSimilarityCalculator(share_model=True, precision="fp16")
+
+    def test_multi_gpu_pool(self, mock_sentence_transformer, mock_pytorch_cos_sim) -> None:
+        """Test multi-GPU encoding starts one pool, passes it to encode and stops it on close."""
+        model = mock_sentence_transformer.return_value
+        model.encode.side_effect = lambda texts, pool=None, **kwargs: MockTensor(np.ones((len(texts), 4)))
+
+        with patch("src.document_analysis.similarity.semantic_similarity.torch.cuda.device_count", return_value=2):
+            with SemanticSimilarityCalculator(use_multi_gpu=True) as calc:
+                calc.calculate_pairwise("first text", "second text")
+                calc.calculate_pairwise("third text", "fourth text")
+
+        model.start_multi_process_pool.assert_called_once()
+        assert model.encode.call_args.kwargs["pool"] is model.start_multi_process_pool.return_value
+        mock_sentence_transformer.stop_multi_process_pool.assert_called_once_with(model.start_multi_process_pool.return_value)
 
     def test_model_loading_failure(self, mock_sentence_transformer) -> None:
         """Test handling of model loading failure."""
@@ -536,6 +630,34 @@ class TestAnalyzeActiveDocumentSimilarities:
         assert isinstance(df, pd.DataFrame)
         model.encode.assert_called()
 
+    def test_analyze_active_in_chunks(self, temp_files) -> None:
+        """Test documents loaded and encoded in chunks match a single pass."""
+        files, root_dir = temp_files
+        model = Mock()
+        model.encode.side_effect = lambda texts, **kwargs: torch.tensor([[len(t), t.count("e"), 1.0] for t in texts])
+
+        single = analyze_active_document_similarities(files, root_dir, threshold=0.1, model=model)
+        with patch("src.document_analysis.similarity.semantic_similarity.DOCUMENT_CHUNK_SIZE", 2):
+            chunked = analyze_active_document_similarities(files + files[:1], root_dir, threshold=0.1, model=model)
+
+        assert [len(call.args[0]) for call in model.encode.call_args_list] == [4, 2, 2]
+        pd.testing.assert_frame_equal(chunked, single)
+
+    def test_legacy_functions_share_model(self, mock_sentence_transformer, mock_pytorch_cos_sim, temp_files) -> None:
+        """Test repeated legacy calls, with or without a calculator, load the default model once."""
+        files, root_dir = temp_files
+
+        analyze_active_document_similarities(files, root_dir, threshold=0.1)
+        analyze_active_document_similarities(files, root_dir, threshold=0.1)
+        create_similarity_matrix(files, root_dir)
+
+        mock_sentence_transformer.assert_called_once()
+
+        # The shared model is released only by clear_model_cache
+        clear_model_cache()
+        create_similarity_matrix(files, root_dir)
+        assert mock_sentence_transformer.call_count == 2
+
     def test_analyze_active_model_loading_failure(self, mock_sentence_transformer, temp_files) -> None:
         """Test handling of model loading failure."""
         files, root_dir = temp_files
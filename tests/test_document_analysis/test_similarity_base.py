@@ -82,6 +82,13 @@ class TestSimilarityResult:
         result2 = SimilarityResult(source="a", target="b", score=1.0, technique="test")
         assert result2.score == 1.0
 
+    def test_similarity_result_create_unchecked(self) -> None:
+        """Test the unchecked factory matches the validated constructor."""
+        result = SimilarityResult.create_unchecked("doc1", "doc2", 0.85, "cosine")
+
+        assert result == SimilarityResult(source="doc1", target="doc2", score=0.85, technique="cosine")
+        assert not hasattr(result, "__dict__")  # Slotted, no per-instance dict
+
 
 class TestSimilarityCalculatorProtocol:
     """Test the SimilarityCalculator protocol."""
@@ -376,6 +383,20 @@ class TestClusteringMixin:
         assert len(clusters) == 1
         assert sorted(clusters[0]) == [0, 1, 2]
 
+    def test_find_clusters_transitive(self) -> None:
+        """Test that chained similarities join one cluster."""
+        mixin = ClusteringMixin()
+
+        # 0~1 and 1~2, but 0 and 2 are not directly similar
+        matrix = np.array([
+            [1.0, 0.9, 0.1, 0.0],
+            [0.9, 1.0, 0.85, 0.0],
+            [0.1, 0.85, 1.0, 0.0],
+            [0.0, 0.0, 0.0, 1.0],
+        ])
+
+        assert mixin.find_clusters(matrix, threshold=0.8) == [[0, 1, 2]]
+
     def test_find_clusters_no_clusters(self) -> None:
         """Test clustering when no clusters exist."""
         mixin = ClusteringMixin()
@@ -468,6 +489,21 @@ class TestClusteringMixin:
 class TestIntegration:
     """Integration tests for similarity base module."""
 
+    def test_calculate_matrix_uses_batch_hook(self) -> None:
+        """Test a batch override replaces the pairwise loop."""
+
+        class BatchCalculator(BaseSimilarityCalculator):
+            def _calculate_similarity(self, text1: str, text2: str) -> float:
+                raise AssertionError("pairwise path should not run")
+
+            def _calculate_batch(self, texts: list[str]) -> np.ndarray:
+                return np.array([[0.9, 0.2, 1.3], [0.2, 0.9, 0.6], [1.3, 0.6, 0.9]])
+
+        matrix = BatchCalculator(name="batch").calculate_matrix(["a", "b", "c"], threshold=0.5)
+
+        assert matrix.dtype == np.float32
+        np.testing.assert_allclose(matrix, [[1.0, 0.0, 1.0], [0.0, 1.0, 0.6], [1.0, 0.6, 1.0]])
+
     def test_concrete_calculator_with_clustering(self) -> None:
         """Test using concrete calculator with clustering mixin."""
         
@@ -511,7 +547,7 @@ class TestIntegration:
         
         # Should work as SimilarityCalculator
         assert calc.calculate_pairwise("a", "b") == 0.5
-        assert isinstance(calc.calculate_matrix(["a", "b"]), list)
+        assert isinstance(calc.calculate_matrix(["a", "b"]), np.ndarray)
         
         results = calc.find_similar_documents(
             [Path("query.txt")],
@@ -6,6 +6,8 @@ edge cases, and error handling according to CLAUDE.md standards.
 """
 
 import os
+import re
+import stat
 import tempfile
 from pathlib import Path
 from typing import Any
@@ -71,6 +73,22 @@ class TestValidateFilePath:
         result = validate_file_path(str(test_file))
         assert result == test_file.resolve()
 
+    def test_validate_file_path_uses_stat_result(self, tmp_path: Path) -> None:
+        """Test that existence, type and size checks use a supplied stat result."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("content")
+        real_stat = test_file.stat()
+        huge_stat = os.stat_result((real_stat.st_mode, *real_stat[1:6], 100 * 1024 * 1024, *real_stat[7:]))
+
+        with pytest.raises(ValidationError, match="exceeds maximum size"):
+            validate_file_path(test_file, stat_result=huge_stat)
+
+        dir_stat = os.stat_result((stat.S_IFDIR | 0o755, *real_stat[1:]))
+        with pytest.raises(ValidationError, match="Path is not a file"):
+            validate_file_path(test_file, stat_result=dir_stat)
+
+        assert validate_file_path(test_file, stat_result=real_stat) == test_file.resolve()
+
     def test_validate_file_path_none_raises_error(self) -> None:
         """Test None path raises ValidationError."""
         with pytest.raises(ValidationError, match="File path cannot be None"):
@@ -293,6 +311,15 @@ class TestValidateStringInput:
         with pytest.raises(ValidationError, match="does not match pattern"):
             validate_string_input("123test", "field", pattern=r"^[a-z]+\d+$")
 
+    def test_validate_string_input_compiled_pattern(self) -> None:
+        """Test string validation with a precompiled regex pattern."""
+        compiled = re.compile(r"^[a-z]+\d+$")
+
+        assert validate_string_input("test123", "field", pattern=compiled) == "test123"
+
+        with pytest.raises(ValidationError, match=r"does not match pattern: \^\[a-z\]"):
+            validate_string_input("123test", "field", pattern=compiled)
+
 
 class TestValidateListInput:
     """Test validate_list_input function."""